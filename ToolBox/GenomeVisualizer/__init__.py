@@ -5,26 +5,35 @@ try:
 except PackageNotFoundError:
     __version__ = "0.0.2"
 
-from .basic import load_genome_from_txt, FrequencyMap, FrequentWords
-from .motifs import Count, Profile, Consensus, Score, Pr, ProfileMostProbableKmer, GreedyMotifSearch, CountWithPseudocounts, ProfileWithPseudocounts, GreedyMotifSearchWithPseudocounts, Motifs, RandomMotifs, RandomizedMotifSearch, Normalize, WeightedDie, ProfileGeneratedString, GibbsSampler
-from .replication import PatternCount, Reverse, Complement, ReverseComplement, PatternMatching, FasterSymbolArray, SkewArray, MinimumSkew, HammingDistance, ApproximatePatternMatching, ApproximatePatternCount
-from .visualization import plot_symbol_array, plot_skew_array_with_ori, plot_motiflogo
+from .basic import load_genome_from_txt, load_genome, iter_genome_chunks, PackedGenome, FrequencyMap, FrequentWords, KmerCounts, CountKmers, KmerSketch, FrequentWordsStreaming, FindClumps
+from .motifs import Count, Profile, Consensus, Score, Pr, ProfileMostProbableKmer, GreedyMotifSearch, CountWithPseudocounts, ProfileWithPseudocounts, GreedyMotifSearchWithPseudocounts, Motifs, RandomMotifs, RandomizedMotifSearch, Normalize, WeightedDie, ProfileGeneratedString, GibbsSampler, CountMatrix, ProfileMatrix, ScanProfile, MotifSearchRestarts, ProfileRandomKmer, PWM, DistanceBetweenPatternAndStrings, MedianString
+from .replication import PatternCount, Reverse, Complement, ReverseComplement, PatternMatching, FasterSymbolArray, SkewArray, MinimumSkew, HammingDistance, ApproximatePatternMatching, ApproximatePatternCount, GenomeIndex, PatternMatchingMany, CompactSkewArray, StreamingMinimumSkew, WindowedComposition, ReverseComplementFile, PatternMatchingBothStrands, ApproximatePatternMatchingBothStrands, FrequentWordsWithMismatches, HammingDistances, HammingDistanceMatrix
+from .visualization import plot_symbol_array, plot_skew_array_with_ori, plot_motiflogo, decimate_minmax
 
 __all__ = [
     # Basic
-    "FrequencyMap", "FrequentWords","load_genome_from_txt",
+    "FrequencyMap", "FrequentWords", "CountKmers", "KmerCounts",
+    "KmerSketch", "FrequentWordsStreaming", "FindClumps","load_genome_from_txt", "load_genome", "iter_genome_chunks",
+    "PackedGenome",
     # Motifs
     "Count", "Profile", "Consensus", "Score", "Pr", "ProfileMostProbableKmer",
     "GreedyMotifSearch", "CountWithPseudocounts", "ProfileWithPseudocounts",
     "GreedyMotifSearchWithPseudocounts", "Motifs", "RandomMotifs",
     "RandomizedMotifSearch", "Normalize", "WeightedDie",
-    "ProfileGeneratedString", "GibbsSampler",
+    "ProfileGeneratedString", "GibbsSampler", "CountMatrix", "ProfileMatrix",
+    "ScanProfile", "MotifSearchRestarts", "ProfileRandomKmer", "PWM",
+    "DistanceBetweenPatternAndStrings", "MedianString",
     # Replication
     "PatternCount", "Reverse", "Complement", "ReverseComplement",
     "PatternMatching", "FasterSymbolArray", "SkewArray", "MinimumSkew",
     "HammingDistance", "ApproximatePatternMatching", "ApproximatePatternCount",
+    "GenomeIndex", "PatternMatchingMany", "CompactSkewArray", "StreamingMinimumSkew",
+    "WindowedComposition", "ReverseComplementFile",
+    "PatternMatchingBothStrands", "ApproximatePatternMatchingBothStrands",
+    "FrequentWordsWithMismatches", "HammingDistances", "HammingDistanceMatrix",
     # Visualization
     "plot_symbol_array", "plot_skew_array_with_ori","plot_motiflogo",
+    "decimate_minmax",
     # Meta
     "__version__",
 ]
\ No newline at end of file
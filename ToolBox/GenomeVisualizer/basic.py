@@ -1,9 +1,162 @@
+import math
+import mmap
+import operator
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+_WHITESPACE = b" \t\r\n\v\f"
+_UPPERCASE = bytes.maketrans(b"acgt", b"ACGT")
+
+# 2-bit base codes: A=0, C=1, G=2, T=3 (255 marks an invalid character)
+_BASE_CODES = np.full(256, 255, dtype=np.uint8)
+_BASE_CODES[np.frombuffer(b"ACGT", dtype=np.uint8)] = np.arange(4, dtype=np.uint8)
+_BASE_CODES[np.frombuffer(b"acgt", dtype=np.uint8)] = np.arange(4, dtype=np.uint8)
+_BASE_LETTERS = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+
+def _clean_block(block: bytes, line_start: bool = True, header: bool = False) -> tuple[bytes, bool, bool]:
+    """
+    Removes FASTA header lines and whitespace from a block of a genome file and validates the rest.
+
+    A block may be cut in the middle of a line: `line_start` tells whether the block starts at 
+    the start of a line and `header` whether the line it continues is a header. Returns the 
+    cleaned block and the same two flags for the block that follows it.
+    """
+    ends_line = block.endswith(b"\n")
+    if header or b">" in block or b";" in block:
+        lines = block.split(b"\n")
+        kept = []
+        if not line_start:
+            # the first piece continues the line cut at the end of the previous block
+            first = lines.pop(0)
+            if not header:
+                kept.append(first)
+        kept += [line for line in lines if not line.startswith((b">", b";"))]
+        if lines:
+            header = lines[-1].startswith((b">", b";"))
+        block = b"".join(kept)
+    block = block.translate(_UPPERCASE, _WHITESPACE)
+    if block.translate(None, b"ACGT"):
+        raise ValueError("The file contains invalid DNA characters.")
+    return block, ends_line, header
+
+def _iter_sequence_blocks(filepath: str, block_size: int = 1 << 22) -> Iterator[bytes]:
+    """Memory-maps a genome file and yields its cleaned sequence in blocks of at most `block_size` file bytes."""
+    with open(filepath, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError("The file is empty.")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            line_start, header = True, False
+            for start in range(0, size, block_size):
+                # blocks may end mid-line, the flags carry the header state across the cut
+                block, line_start, header = _clean_block(mm[start:start + block_size], line_start, header)
+                yield block
+
+def _iter_sequence_blocks_reversed(filepath: str, block_size: int = 1 << 22) -> Iterator[bytes]:
+    """Memory-maps a genome file and yields its cleaned sequence in blocks of at most `block_size` file bytes, last block first."""
+    with open(filepath, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError("The file is empty.")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            # start of the line containing the current block start, reused while blocks stay in that line
+            line = end
+            while end > 0:
+                start = max(end - block_size, 0)
+                if start < line:
+                    line = mm.rfind(b"\n", 0, start) + 1
+                header = mm[line:line + 1] in (b">", b";")
+                yield _clean_block(mm[start:end], start == line, header)[0]
+                end = start
+
+def _read_genome_bytes(filepath: str) -> bytearray:
+    """Reads the whole cleaned sequence of a genome file into a single byte buffer."""
+    buffer = bytearray()
+    for block in _iter_sequence_blocks(filepath):
+        buffer += block
+    if not buffer:
+        raise ValueError("The file is empty.")
+    return buffer
+
+def load_genome(filepath: str) -> str:
+    """
+    Loads a genome sequence from a plain text or FASTA file.
+
+    The file is memory-mapped and processed block by block: FASTA header lines 
+    (starting with '>' or ';') are skipped, whitespace is removed, lowercase bases 
+    are uppercased and the characters are validated in a single pass. Multi-record 
+    FASTA files are concatenated into one sequence in file order.
+
+    Args:
+        filepath (str): Path to the genome file (plain text or FASTA).
+
+    Returns:
+        str: A cleaned DNA sequence as a single string.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        ValueError: If the file is empty or contains invalid characters.
+
+    Example:
+        >>> genome = load_genome("data/ecoli.fasta")
+        >>> genome[:10]
+        'AGCTTTTCAT'
+    """
+    return _read_genome_bytes(filepath).decode("ascii")
+
+def iter_genome_chunks(filepath: str, chunk_size: int = 1 << 20) -> Iterator[str]:
+    """
+    Lazily yields a genome sequence from a plain text or FASTA file in fixed-size chunks.
+
+    The file is cleaned exactly like in `load_genome()`, but only one block of the 
+    file is held in memory at a time, so downstream analysis can start before the 
+    whole file is read. Every chunk has `chunk_size` bases except the last one.
+
+    Args:
+        filepath (str): Path to the genome file (plain text or FASTA).
+        chunk_size (int, optional): Number of bases per chunk. Default is 1 Mbp.
+
+    Returns:
+        Iterator[str]: Consecutive, non-overlapping pieces of the cleaned DNA sequence.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        ValueError: If the file is empty or contains invalid characters. Invalid 
+            characters are reported when the chunk containing them is reached.
+
+    Example:
+        >>> for chunk in iter_genome_chunks("data/ecoli.fasta", 1000000):
+        ...     print(len(chunk))
+        1000000
+        ...
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+    pending = bytearray()
+    produced = False
+    for block in _iter_sequence_blocks(filepath):
+        pending += block
+        while len(pending) >= chunk_size:
+            yield pending[:chunk_size].decode("ascii")
+            del pending[:chunk_size]
+            produced = True
+    if pending:
+        yield pending.decode("ascii")
+    elif not produced:
+        raise ValueError("The file is empty.")
+
 def load_genome_from_txt(filepath: str) -> str:
     """
     Loads a genome sequence from a plain text (.txt) file.
 
-    This function reads the entire content of a text file and removes any 
+    This function reads the content of a text file and removes any 
     whitespace or newline characters, returning a continuous DNA string.
+    It is a thin wrapper around `load_genome()`.
 
     Args:
         filepath (str): Path to the genome file (must be a .txt file containing ACGT characters).
@@ -20,17 +173,396 @@ def load_genome_from_txt(filepath: str) -> str:
         >>> genome[:10]
         'AGCTTTTCAT'
     """
-    with open(filepath, "r") as file:
-        content = file.read().replace("\n", "").replace(" ", "").upper()
+    return load_genome(filepath)
 
-    if not content:
-        raise ValueError("The file is empty.")
-    if not set(content).issubset({"A", "C", "G", "T"}):
-        raise ValueError("The file contains invalid DNA characters.")
+def _encode(sequence: str | bytes) -> np.ndarray:
+    """Converts a DNA string into an array of 2-bit base codes (A=0, C=1, G=2, T=3)."""
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii")
+    codes = _BASE_CODES[np.frombuffer(sequence, dtype=np.uint8)]
+    if codes.size and codes.max() > 3:
+        raise ValueError("The sequence contains invalid DNA characters.")
+    return codes
+
+def _pack(codes: np.ndarray) -> np.ndarray:
+    """Packs an array of 2-bit base codes four to a byte, first base in the highest bits."""
+    padding = -len(codes) % 4
+    if padding:
+        codes = np.concatenate((codes, np.zeros(padding, dtype=np.uint8)))
+    quads = codes.reshape(-1, 4)
+    return (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+
+def _unpack(packed: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Unpacks the base codes of positions start..stop-1 from a packed byte array."""
+    first = start // 4
+    block = packed[first:(stop + 3) // 4]
+    codes = np.empty((len(block), 4), dtype=np.uint8)
+    codes[:, 0] = block >> 6
+    codes[:, 1] = (block >> 4) & 3
+    codes[:, 2] = (block >> 2) & 3
+    codes[:, 3] = block & 3
+    offset = start - 4 * first
+    return codes.ravel()[offset:offset + stop - start]
+
+class PackedGenome:
+    """
+    A DNA sequence stored with 2 bits per base in a NumPy byte array.
+
+    A packed genome uses a quarter of the memory of the equivalent `str`. Slicing 
+    with step 1 returns a new `PackedGenome` that shares the underlying buffer, so 
+    windows such as `genome[i:i+k]` never copy the sequence. `str(genome)` decodes 
+    the sequence when a plain string is needed, and `codes()` returns the bases as 
+    an array of 2-bit codes (A=0, C=1, G=2, T=3) for vectorized analysis.
+
+    The analysis functions of the toolbox accept a `PackedGenome` wherever they 
+    accept a DNA string.
+
+    Args:
+        sequence (str | bytes, optional): DNA sequence consisting of 'A', 'C', 'G' and 'T' 
+            (lowercase is accepted). Default is the empty sequence.
+
+    Raises:
+        ValueError: If the sequence contains invalid characters.
+
+    Example:
+        >>> genome = PackedGenome("ATGCATGATG")
+        >>> len(genome), genome.nbytes
+        (10, 3)
+        >>> str(genome[4:7])
+        'ATG'
+        >>> PatternMatching("ATG", genome)
+        [0, 4, 7]
+    """
+    __slots__ = ("_packed", "_start", "_length")
+
+    def __init__(self, sequence: str | bytes = "") -> None:
+        codes = _encode(sequence)
+        self._packed = _pack(codes)
+        self._start = 0
+        self._length = len(codes)
+
+    @classmethod
+    def _view(cls, packed: np.ndarray, start: int, length: int) -> "PackedGenome":
+        genome = cls.__new__(cls)
+        genome._packed = packed
+        genome._start = start
+        genome._length = length
+        return genome
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray) -> "PackedGenome":
+        """
+        Creates a packed genome from an array of 2-bit base codes (A=0, C=1, G=2, T=3).
+
+        Args:
+            codes (np.ndarray): Integer array with values between 0 and 3.
+
+        Returns:
+            PackedGenome: The packed sequence.
+        """
+        codes = np.asarray(codes, dtype=np.uint8)
+        if codes.size and codes.max() > 3:
+            raise ValueError("Base codes must be between 0 and 3.")
+        return cls._view(_pack(codes), 0, len(codes))
+
+    @classmethod
+    def from_file(cls, filepath: str) -> "PackedGenome":
+        """
+        Loads a genome sequence from a plain text or FASTA file directly into packed form.
+
+        The file is cleaned exactly like in `load_genome()`, block by block, so the 
+        unpacked sequence is never held in memory as a whole.
+
+        Args:
+            filepath (str): Path to the genome file (plain text or FASTA).
+
+        Returns:
+            PackedGenome: The cleaned and packed DNA sequence.
+
+        Raises:
+            FileNotFoundError: If the specified file does not exist.
+            ValueError: If the file is empty or contains invalid characters.
+
+        Example:
+            >>> genome = PackedGenome.from_file("data/ecoli.fasta")
+            >>> str(genome[:10])
+            'AGCTTTTCAT'
+        """
+        pieces = []
+        carry = np.empty(0, dtype=np.uint8)
+        length = 0
+        for block in _iter_sequence_blocks(filepath):
+            codes = _BASE_CODES[np.frombuffer(block, dtype=np.uint8)]
+            if carry.size:
+                codes = np.concatenate((carry, codes))
+            # pack whole bytes only, the remaining bases are carried into the next block
+            whole = len(codes) - len(codes) % 4
+            pieces.append(_pack(codes[:whole]))
+            carry = codes[whole:]
+            length += len(block)
+        if length == 0:
+            raise ValueError("The file is empty.")
+        pieces.append(_pack(carry))
+        return cls._view(np.concatenate(pieces), 0, length)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the packed buffer."""
+        return self._packed.nbytes
+
+    def codes(self) -> np.ndarray:
+        """
+        Returns the bases of the sequence as 2-bit codes.
+
+        Returns:
+            np.ndarray: A uint8 array with one code per base (A=0, C=1, G=2, T=3).
+        """
+        return _unpack(self._packed, self._start, self._start + self._length)
+
+    def tobytes(self) -> bytes:
+        """Returns the sequence as ASCII bytes."""
+        return _BASE_LETTERS[self.codes()].tobytes()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key: int | slice) -> "str | PackedGenome":
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                return PackedGenome.from_codes(self.codes()[key])
+            return self._view(self._packed, self._start + start, max(stop - start, 0))
+        index = operator.index(key)
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("PackedGenome index out of range")
+        position = self._start + index
+        return "ACGT"[(self._packed[position >> 2] >> (6 - 2 * (position & 3))) & 3]
+
+    def __iter__(self) -> Iterator[str]:
+        for start in range(0, self._length, 1 << 16):
+            yield from str(self[start:start + (1 << 16)])
+
+    def __str__(self) -> str:
+        return self.tobytes().decode("ascii")
+
+    def __repr__(self) -> str:
+        if self._length <= 20:
+            return f"PackedGenome('{self}')"
+        return f"PackedGenome('{self[:20]}...', length={self._length})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PackedGenome):
+            return self._length == other._length and np.array_equal(self.codes(), other.codes())
+        if isinstance(other, str):
+            return self._length == len(other) and str(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+def _as_str(sequence: str | PackedGenome) -> str:
+    """Returns a DNA sequence as a plain string, decoding it if it is packed."""
+    return sequence if isinstance(sequence, str) else str(sequence)
+
+def _as_codes(sequence: str | PackedGenome) -> np.ndarray:
+    """Returns the 2-bit base codes of a DNA sequence."""
+    if isinstance(sequence, PackedGenome):
+        return sequence.codes()
+    return _encode(sequence)
+
+def _kmer_codes(codes: np.ndarray, k: int) -> np.ndarray:
+    """Encodes every k-mer of a base code array as an integer using a rolling 2-bit shift."""
+    n = len(codes) - k + 1
+    if n <= 0:
+        return np.empty(0, dtype=np.uint64)
+    kmers = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        kmers <<= np.uint64(2)
+        kmers |= codes[j:j + n]
+    return kmers
+
+def _encode_kmer(kmer: str) -> int:
+    """Encodes a single k-mer as an integer, with the first base in the highest bits."""
+    code = 0
+    for base in _encode(kmer).tolist():
+        code = (code << 2) | base
+    return code
 
-    return content
+def _decode_kmers(kmers: np.ndarray, k: int) -> list[str]:
+    """Decodes an array of integer k-mer codes back into strings."""
+    shifts = np.arange(2 * (k - 1), -1, -2, dtype=np.uint64)
+    letters = _BASE_LETTERS[(np.asarray(kmers, dtype=np.uint64)[:, None] >> shifts) & np.uint64(3)]
+    text = letters.tobytes().decode("ascii")
+    return [text[i:i + k] for i in range(0, len(text), k)]
 
-def FrequencyMap(Text: str, k: int) -> dict[str, int]:
+class KmerCounts(Mapping):
+    """
+    Compact k-mer count table returned by `CountKmers()`.
+
+    The counts are stored as two NumPy arrays: the integer codes of the distinct 
+    k-mers in sorted (lexicographic) order and their counts. The table also behaves 
+    as a read-only dictionary mapping each k-mer string to its count, so it can be 
+    used wherever the result of `FrequencyMap()` is expected.
+
+    Attributes:
+        k (int): Length of the counted k-mers.
+        codes (np.ndarray): Sorted uint64 codes of the distinct k-mers (2 bits per base, A=0, C=1, G=2, T=3).
+        counts (np.ndarray): int64 number of occurrences of each k-mer in `codes`.
+
+    Example:
+        >>> counts = CountKmers("ATATA", 3)
+        >>> counts["ATA"], len(counts)
+        (2, 2)
+        >>> dict(counts)
+        {'ATA': 2, 'TAT': 1}
+    """
+
+    def __init__(self, k: int, codes: np.ndarray, counts: np.ndarray) -> None:
+        self.k = k
+        self.codes = codes
+        self.counts = counts
+
+    def _index(self, kmer: object) -> int:
+        if not isinstance(kmer, str) or len(kmer) != self.k:
+            return -1
+        try:
+            code = np.uint64(_encode_kmer(kmer))
+        except ValueError:
+            return -1
+        index = int(np.searchsorted(self.codes, code))
+        if index < len(self.codes) and self.codes[index] == code:
+            return index
+        return -1
+
+    def __getitem__(self, kmer: str) -> int:
+        index = self._index(kmer)
+        if index < 0:
+            raise KeyError(kmer)
+        return int(self.counts[index])
+
+    def __contains__(self, kmer: object) -> bool:
+        return self._index(kmer) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_decode_kmers(self.codes, self.k))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __repr__(self) -> str:
+        return f"KmerCounts(k={self.k}, distinct={len(self)}, total={int(self.counts.sum())})"
+
+    def to_dict(self) -> dict[str, int]:
+        """Returns the counts as a plain dictionary in lexicographic k-mer order."""
+        return dict(zip(_decode_kmers(self.codes, self.k), self.counts.tolist()))
+
+    def most_frequent(self) -> list[str]:
+        """Returns the k-mers with the highest count in lexicographic order."""
+        if not len(self.counts):
+            return []
+        return _decode_kmers(self.codes[self.counts == self.counts.max()], self.k)
+
+def _count_kmer_codes(kmers: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Counts integer k-mer codes, returning the sorted distinct codes and their counts."""
+    if k <= 12 and 4 ** k <= 4 * len(kmers):
+        table = np.bincount(kmers.astype(np.int64), minlength=4 ** k)
+        present = np.flatnonzero(table)
+        return present.astype(np.uint64), table[present]
+    codes, counts = np.unique(kmers, return_counts=True)
+    return codes, counts.astype(np.int64)
+
+def _count_shared_chunk(name: str, size: int, start: int, stop: int, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Counts the k-mers of bases start..stop-1 of a packed genome held in shared memory."""
+    shm = SharedMemory(name=name)
+    try:
+        packed = np.ndarray((size,), dtype=np.uint8, buffer=shm.buf)
+        codes = _unpack(packed, start, stop)
+        del packed
+        return _count_kmer_codes(_kmer_codes(codes, k), k)
+    finally:
+        shm.close()
+
+def _merge_kmer_counts(parts: list[tuple[np.ndarray, np.ndarray]]) -> tuple[np.ndarray, np.ndarray]:
+    """Merges partial (codes, counts) tables into one table with sorted distinct codes."""
+    codes = np.concatenate([part[0] for part in parts])
+    counts = np.concatenate([part[1] for part in parts])
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    counts = counts[order]
+    if not len(codes):
+        return codes, counts
+    starts = np.flatnonzero(np.concatenate(([True], codes[1:] != codes[:-1])))
+    return codes[starts], np.add.reduceat(counts, starts)
+
+def _count_kmers_parallel(Text: str | PackedGenome, k: int, processes: int) -> tuple[np.ndarray, np.ndarray]:
+    """Counts k-mers in chunks overlapping by k-1 bases on a process pool sharing the packed genome."""
+    if isinstance(Text, PackedGenome):
+        packed, offset, length = Text._packed, Text._start, len(Text)
+    else:
+        codes = _encode(Text)
+        packed, offset, length = _pack(codes), 0, len(codes)
+        del codes
+    windows = length - k + 1
+    shm = SharedMemory(create=True, size=max(packed.nbytes, 1))
+    try:
+        np.ndarray((packed.nbytes,), dtype=np.uint8, buffer=shm.buf)[:] = packed
+        step = -(-windows // processes)
+        with ProcessPoolExecutor(processes) as pool:
+            futures = [
+                pool.submit(_count_shared_chunk, shm.name, packed.nbytes, offset + start, offset + min(start + step, windows) + k - 1, k)
+                for start in range(0, windows, step)
+            ]
+            parts = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+    return _merge_kmer_counts(parts)
+
+def CountKmers(Text: str | PackedGenome, k: int, processes: int = 1) -> KmerCounts:
+    """
+    Counts all k-mers of a DNA sequence with a vectorized rolling-hash engine.
+
+    Every k-mer is encoded as an integer (2 bits per base) by shifting the codes of 
+    the sequence into a NumPy array, one position at a time, so all windows are 
+    encoded in k vectorized passes instead of slicing a new string per window. The 
+    codes are then counted in bulk, with `np.bincount` when the table of all 4^k 
+    k-mers is small and with `np.unique` otherwise.
+
+    With `processes` greater than 1, the genome is packed into shared memory (so it 
+    is not pickled to every worker), split into chunks overlapping by k-1 bases, 
+    counted on a process pool and the partial counts are merged. The result is 
+    identical to the serial one.
+
+    Args:
+        Text (str | PackedGenome): The DNA sequence to scan (only 'A', 'C', 'G', 'T').
+        k (int): Length of the k-mers to count, between 1 and 32.
+        processes (int, optional): Number of worker processes. Default is 1 (no pool).
+
+    Returns:
+        KmerCounts: A compact count table, which also works as a read-only dictionary.
+
+    Raises:
+        ValueError: If `k` is out of range or the sequence contains invalid characters.
+
+    Example:
+        >>> CountKmers("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4).most_frequent()
+        ['CATG', 'GCAT']
+    """
+    if not 1 <= k <= 32:
+        raise ValueError("k must be between 1 and 32.")
+    if processes > 1 and len(Text) - k + 1 >= 2 * processes:
+        return KmerCounts(k, *_count_kmers_parallel(Text, k, processes))
+    return KmerCounts(k, *_count_kmer_codes(_kmer_codes(_as_codes(Text), k), k))
+
+def _countable(Text: str | PackedGenome, k: int) -> bool:
+    """Tells whether `CountKmers()` applies to a text as is: k between 1 and 32 and only uppercase 'A', 'C', 'G', 'T'."""
+    if not 1 <= k <= 32:
+        return False
+    return isinstance(Text, PackedGenome) or not Text.encode("ascii", "replace").translate(None, b"ACGT")
+
+def FrequencyMap(Text: str | PackedGenome, k: int, processes: int = 1) -> dict[str, int]:
     """
     Computes the frequency of all k-length substrings (k-mers) in a DNA sequence.
 
@@ -38,9 +570,15 @@ def FrequencyMap(Text: str, k: int) -> dict[str, int]:
     using a sliding window. The output is a dictionary where each key is a unique 
     k-mer, and the value is the number of occurrences.
 
+    For k up to 32 the counting is done by `CountKmers()` and the keys are in 
+    lexicographic order; longer k-mers and sequences with characters other than 
+    'A', 'C', 'G' and 'T' (including lowercase bases, which are kept as they are) 
+    are counted with a plain dictionary.
+
     Args:
-        Text (str): The DNA sequence to scan.
+        Text (str | PackedGenome): The DNA sequence to scan.
         k (int): Length of the k-mers to count.
+        processes (int, optional): Number of worker processes used by `CountKmers()`. Default is 1.
 
     Returns:
         dict[str, int]: A dictionary mapping each k-mer to its count in the sequence.
@@ -49,6 +587,9 @@ def FrequencyMap(Text: str, k: int) -> dict[str, int]:
         >>> FrequencyMap("ATATA", 3)
         {'ATA': 2, 'TAT': 1}
     """
+    if _countable(Text, k):
+        return CountKmers(Text, k, processes).to_dict()
+    Text = _as_str(Text)
     freq = {}
     n = len(Text)
     for i in range(n-k+1):
@@ -59,16 +600,18 @@ def FrequencyMap(Text: str, k: int) -> dict[str, int]:
         freq[Pattern] += 1
     return freq
 
-def FrequentWords(Text: str, k: int) -> list[str]:
+def FrequentWords(Text: str | PackedGenome, k: int, processes: int = 1) -> list[str]:
     """
     Identifies the most frequent k-length substrings (k-mers) in a DNA sequence.
 
-    This function uses FrequencyMap to find all k-mers in the sequence and then 
-    returns those that occur with the highest frequency.
+    This function uses the vectorized `CountKmers()` engine to count all k-mers in 
+    the sequence (falling back to FrequencyMap where it does not apply) and then 
+    returns those that occur with the highest frequency, in lexicographic order.
 
     Args:
-        Text (str): The DNA sequence to search.
+        Text (str | PackedGenome): The DNA sequence to search.
         k (int): Length of the k-mers.
+        processes (int, optional): Number of worker processes used by `CountKmers()`. Default is 1.
 
     Returns:
         list[str]: A list of k-mers with the highest frequency in the sequence.
@@ -77,6 +620,8 @@ def FrequentWords(Text: str, k: int) -> list[str]:
         >>> FrequentWords("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4)
         ['CATG', 'GCAT']
     """
+    if _countable(Text, k):
+        return CountKmers(Text, k, processes).most_frequent()
     words = []
     freq = FrequencyMap(Text, k)
     m = max(freq.values())
@@ -87,6 +632,251 @@ def FrequentWords(Text: str, k: int) -> list[str]:
     return words
 
 
+class KmerSketch:
+    """
+    Bounded-memory Count-Min sketch of k-mer counts with a table of heavy-hitter candidates.
+
+    Chunks of one sequence are added with `update()`; the last k-1 bases of each chunk 
+    are carried over, so k-mers spanning chunk boundaries are counted exactly once. 
+    Each k-mer is hashed into one counter per row of a `depth` x `width` table, and its 
+    count is estimated as the minimum of its counters. The estimate never undercounts 
+    and, with probability at least 1 - e^-depth, overcounts by at most `error_bound`. 
+    The `capacity` k-mers with the highest estimates are kept as candidates for `top()`.
+
+    Memory use is fixed by `width`, `depth` and `capacity` and does not grow with the genome.
+
+    Args:
+        k (int): Length of the k-mers, between 1 and 32.
+        width (int, optional): Counters per row, a power of two. Default is 2^20.
+        depth (int, optional): Number of independent hash rows. Default is 4.
+        capacity (int, optional): Number of heavy-hitter candidates kept. Default is 1000.
+        seed (int, optional): Seed of the hash functions. Default is 0.
+
+    Attributes:
+        total (int): Number of k-mers added so far.
+
+    Example:
+        >>> sketch = KmerSketch(9)
+        >>> for chunk in iter_genome_chunks("data/ecoli.fasta"):
+        ...     sketch.update(chunk)
+        >>> sketch.top(2)
+        [('TTTTTTTTT', 1650), ('AAAAAAAAA', 1602)]
+    """
+
+    def __init__(self, k: int, width: int = 1 << 20, depth: int = 4, capacity: int = 1000, seed: int = 0) -> None:
+        if not 1 <= k <= 32:
+            raise ValueError("k must be between 1 and 32.")
+        if width < 2 or width & (width - 1):
+            raise ValueError("width must be a power of two.")
+        if depth < 1 or capacity < 1:
+            raise ValueError("depth and capacity must be positive.")
+        self.k = k
+        self.width = width
+        self.depth = depth
+        self.capacity = capacity
+        self.total = 0
+        self._table = np.zeros((depth, width), dtype=np.int64)
+        # multiply-shift hashing with one random odd multiplier per row
+        rng = np.random.default_rng(seed)
+        self._multipliers = rng.integers(0, 1 << 63, size=depth, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._shift = np.uint64(64 - width.bit_length() + 1)
+        self._candidates = np.empty(0, dtype=np.uint64)
+        self._tail = np.empty(0, dtype=np.uint8)
+
+    def _buckets(self, kmers: np.ndarray) -> np.ndarray:
+        return ((kmers[None, :] * self._multipliers[:, None]) >> self._shift).astype(np.intp)
+
+    def _estimates(self, kmers: np.ndarray) -> np.ndarray:
+        buckets = self._buckets(kmers)
+        return self._table[np.arange(self.depth)[:, None], buckets].min(axis=0)
+
+    def update(self, chunk: str | PackedGenome) -> None:
+        """
+        Adds the k-mers of the next chunk of the sequence to the sketch.
+
+        Args:
+            chunk (str | PackedGenome): The next consecutive piece of the DNA sequence.
+        """
+        codes = _as_codes(chunk)
+        if self._tail.size:
+            codes = np.concatenate((self._tail, codes))
+        self._tail = codes[max(len(codes) - self.k + 1, 0):]
+        kmers = _kmer_codes(codes, self.k)
+        if not kmers.size:
+            return
+        kmers, counts = np.unique(kmers, return_counts=True)
+        buckets = self._buckets(kmers)
+        for row in range(self.depth):
+            np.add.at(self._table[row], buckets[row], counts)
+        self.total += len(codes) - self.k + 1
+        candidates = np.union1d(self._candidates, kmers)
+        if len(candidates) > self.capacity:
+            keep = np.argpartition(-self._estimates(candidates), self.capacity - 1)[:self.capacity]
+            candidates = np.sort(candidates[keep])
+        self._candidates = candidates
+
+    @property
+    def error_bound(self) -> int:
+        """Maximum overcount of any estimate, with probability at least 1 - e^-depth."""
+        return math.ceil(math.e / self.width * self.total)
+
+    def estimate(self, kmer: str) -> int:
+        """
+        Returns the estimated count of a k-mer (never lower than the true count).
+
+        Args:
+            kmer (str): A DNA string of length k.
+
+        Returns:
+            int: The estimated number of occurrences.
+        """
+        if len(kmer) != self.k:
+            raise ValueError("The k-mer must have length k.")
+        return int(self._estimates(np.array([_encode_kmer(kmer)], dtype=np.uint64))[0])
+
+    def top(self, n: int = 1) -> list[tuple[str, int]]:
+        """
+        Returns the n candidates with the highest estimated counts.
+
+        Args:
+            n (int, optional): Number of k-mers to return. Default is 1.
+
+        Returns:
+            list[tuple[str, int]]: (k-mer, estimated count) pairs, highest count first and 
+            lexicographic among equal counts.
+        """
+        if not self._candidates.size:
+            return []
+        estimates = self._estimates(self._candidates)
+        order = np.lexsort((self._candidates, -estimates))[:n]
+        return list(zip(_decode_kmers(self._candidates[order], self.k), estimates[order].tolist()))
+
+def FrequentWordsStreaming(Chunks: str | PackedGenome | Iterable[str | PackedGenome], k: int, top: int = 1, width: int = 1 << 20, depth: int = 4, capacity: int = 1000, chunk_size: int = 1 << 20) -> list[tuple[str, int, int]]:
+    """
+    Finds the most frequent k-mers of a DNA sequence in bounded memory.
+
+    This streaming variant of `FrequentWords()` feeds the sequence chunk by chunk into 
+    a `KmerSketch` (a Count-Min sketch with a table of heavy-hitter candidates), so its 
+    memory use is fixed by the sketch parameters instead of growing with the number of 
+    distinct k-mers. It is meant for long k-mers (k of 20-32) on multi-megabase input, 
+    and consumes the chunks produced by `iter_genome_chunks()` directly.
+
+    Args:
+        Chunks (str | PackedGenome | Iterable[str | PackedGenome]): The DNA sequence, either 
+            whole or as consecutive chunks (e.g. from `iter_genome_chunks()`).
+        k (int): Length of the k-mers, between 1 and 32.
+        top (int, optional): Number of k-mers to return. Default is 1.
+        width (int, optional): Counters per sketch row, a power of two. Default is 2^20.
+        depth (int, optional): Number of sketch rows. Default is 4.
+        capacity (int, optional): Number of heavy-hitter candidates kept. Default is 1000.
+        chunk_size (int, optional): Chunk length used when a whole sequence is given. Default is 1 Mbp.
+
+    Returns:
+        list[tuple[str, int, int]]: (k-mer, estimated count, lower bound) triples, most 
+        frequent first. With probability at least 1 - e^-depth the true count lies between 
+        the lower bound and the estimate.
+
+    Raises:
+        ValueError: If the parameters are out of range or the sequence contains invalid characters.
+
+    Example:
+        >>> FrequentWordsStreaming(iter_genome_chunks("data/ecoli.fasta"), 24, top=2)
+        [('GCCGGATGCGGCGTGAACGCCTTA', 12, 0), ('CCGGATGCGGCGTGAACGCCTTAT', 12, 0)]
+    """
+    if top < 1 or top > capacity:
+        raise ValueError("top must be between 1 and capacity.")
+    if isinstance(Chunks, (str, PackedGenome)):
+        sequence = Chunks
+        Chunks = (sequence[i:i + chunk_size] for i in range(0, len(sequence), chunk_size))
+    sketch = KmerSketch(k, width, depth, capacity)
+    for chunk in Chunks:
+        sketch.update(chunk)
+    error = sketch.error_bound
+    return [(kmer, count, max(count - error, 0)) for kmer, count in sketch.top(top)]
+
+def _clump_codes(codes: np.ndarray, k: int, L: int, t: int) -> set[int]:
+    """Returns the codes of the k-mers forming an (L, t)-clump in a base code array."""
+    kmers = _kmer_codes(codes, k).tolist()
+    windows = len(codes) - L + 1
+    if windows <= 0:
+        return set()
+    m = L - k + 1
+    clumps = set()
+    # a dense table for short k-mers, a dictionary for longer ones
+    if k <= 10:
+        count = [0] * 4 ** k
+        for kmer in kmers[:m]:
+            count[kmer] += 1
+            if count[kmer] >= t:
+                clumps.add(kmer)
+        for i in range(1, windows):
+            # the window loses its first k-mer and gains a new last one
+            count[kmers[i-1]] -= 1
+            kmer = kmers[i+m-1]
+            count[kmer] += 1
+            if count[kmer] >= t:
+                clumps.add(kmer)
+    else:
+        count = {}
+        for kmer in kmers[:m]:
+            count[kmer] = count.get(kmer, 0) + 1
+            if count[kmer] >= t:
+                clumps.add(kmer)
+        for i in range(1, windows):
+            count[kmers[i-1]] -= 1
+            kmer = kmers[i+m-1]
+            count[kmer] = count.get(kmer, 0) + 1
+            if count[kmer] >= t:
+                clumps.add(kmer)
+    return clumps
+
+def FindClumps(Genome: str | PackedGenome, k: int, L: int, t: int, processes: int = 1) -> list[str]:
+    """
+    Finds all k-mers forming (L, t)-clumps in a DNA sequence.
+
+    A k-mer forms an (L, t)-clump if it appears at least `t` times within some window 
+    of length `L` of the genome. Instead of counting the k-mers of every window from 
+    scratch, this function keeps a single k-mer count table and updates it as the 
+    window slides: the k-mer leaving the window is decremented and the one entering 
+    it is incremented, so the whole genome is processed in O(n) time.
+
+    With `processes` greater than 1, the genome is split into overlapping segments 
+    (each extended by L-1 bases so no window is lost) that are scanned on a process pool.
+
+    Args:
+        Genome (str | PackedGenome): The DNA sequence to scan (only 'A', 'C', 'G', 'T').
+        k (int): Length of the k-mers, between 1 and 32.
+        L (int): Length of the window.
+        t (int): Minimum number of occurrences within a window.
+        processes (int, optional): Number of worker processes. Default is 1 (no pool).
+
+    Returns:
+        list[str]: The distinct k-mers forming clumps, in lexicographic order.
+
+    Raises:
+        ValueError: If the parameters are out of range or the sequence contains invalid characters.
+
+    Example:
+        >>> FindClumps("CGGACTCGACAGATGTGAAGAACGACAATGTGAAGACTCGACACGACAGAGTGAAGAGAAGAGGAAACATTGTAA", 5, 50, 4)
+        ['CGACA', 'GAAGA']
+    """
+    if not 1 <= k <= 32:
+        raise ValueError("k must be between 1 and 32.")
+    if L < k or t < 1:
+        raise ValueError("L must be at least k and t must be positive.")
+    codes = _as_codes(Genome)
+    windows = len(codes) - L + 1
+    if processes <= 1 or windows < 2 * processes:
+        clumps = _clump_codes(codes, k, L, t)
+    else:
+        step = -(-windows // processes)
+        segments = [codes[start:min(start + step, windows) + L - 1] for start in range(0, windows, step)]
+        clumps = set()
+        with ProcessPoolExecutor(processes) as pool:
+            for found in pool.map(_clump_codes, segments, [k] * len(segments), [L] * len(segments), [t] * len(segments)):
+                clumps |= found
+    return _decode_kmers(np.array(sorted(clumps), dtype=np.uint64), k)
+
 def MinPositions(values: list[int]) -> list[int]:
     """
     Given a list of numbers, return all indices in the list that contain the minimum value.
@@ -1,6 +1,93 @@
+import collections
+import itertools
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
 
-def Count(Motifs: list[str]) -> dict[str, list[int]]:
+import numpy as np
+
+from .basic import PackedGenome, _as_codes, _as_str, _encode
+from .replication import HammingDistances, _scan_codes
+
+def _motif_matrix(Motifs: list[str | PackedGenome]) -> np.ndarray:
+    """Stacks equal-length motifs into a t x k matrix of 2-bit base codes (A=0, C=1, G=2, T=3)."""
+    Motifs = [_as_str(Motif) for Motif in Motifs]
+    k = len(Motifs[0])
+    if any(len(Motif) != k for Motif in Motifs):
+        raise ValueError("All motifs must be of equal length.")
+    return _encode("".join(Motifs)).reshape(len(Motifs), k)
+
+def _matrix_dict(matrix: np.ndarray) -> dict[str, list]:
+    """Converts a 4 x k count or profile matrix into a dictionary keyed by 'A', 'C', 'G', 'T'."""
+    return dict(zip("ACGT", matrix.tolist()))
+
+def _score_counts(counts: np.ndarray) -> int:
+    """Returns the score of the motifs behind a 4 x k count matrix (without pseudocounts)."""
+    # every motif that does not carry the consensus base of a column is one mismatch
+    return int((counts.sum(axis=0) - counts.max(axis=0)).sum())
+
+def CountMatrix(Motifs: list[str | PackedGenome] | np.ndarray, pseudocount: int | float = 0) -> np.ndarray:
+    """
+    Computes the count matrix of a list of motifs as a 4 x k NumPy array.
+
+    This is the array form of `Count()`: the motifs are stacked into a t x k matrix of 
+    base codes and every (base, position) pair is counted in a single `np.bincount` call. 
+    Row i holds the counts of 'ACGT'[i], and `pseudocount` is added to every entry.
+
+    Args:
+        Motifs (list[str | PackedGenome] | np.ndarray): A list of DNA strings (motifs) of equal 
+            length, or a t x k matrix of base codes (A=0, C=1, G=2, T=3).
+        pseudocount (int | float, optional): Value added to every count. Default is 0.
+
+    Returns:
+        np.ndarray: A 4 x k array of counts (int64 for an integer pseudocount, float64 otherwise).
+
+    Raises:
+        ValueError: If the motifs differ in length or contain invalid DNA characters.
+
+    Example:
+        >>> CountMatrix(["ATG", "ACG", "AAG", "AGG", "ATG"], pseudocount=1)
+        array([[6, 2, 1],
+               [1, 2, 1],
+               [1, 2, 6],
+               [1, 3, 1]])
+    """
+    codes = Motifs if isinstance(Motifs, np.ndarray) else _motif_matrix(Motifs)
+    k = codes.shape[1]
+    # flat index base * k + position, so the counts come out already in 4 x k layout
+    flat = codes.astype(np.intp) * k + np.arange(k)
+    counts = np.bincount(flat.ravel(), minlength=4 * k).reshape(4, k)
+    return counts + pseudocount
+
+def ProfileMatrix(Motifs: list[str | PackedGenome] | np.ndarray, pseudocount: int | float = 0) -> np.ndarray:
+    """
+    Computes the profile matrix of a list of motifs as a 4 x k NumPy array.
+
+    The counts of `CountMatrix()` (including pseudocounts) are divided by the column total 
+    t + 4 * pseudocount, so every column sums to 1.
+
+    Args:
+        Motifs (list[str | PackedGenome] | np.ndarray): A list of DNA strings (motifs) of equal 
+            length, or a t x k matrix of base codes (A=0, C=1, G=2, T=3).
+        pseudocount (int | float, optional): Value added to every count. Default is 0.
+
+    Returns:
+        np.ndarray: A 4 x k float64 array of nucleotide frequencies, rows in 'ACGT' order.
+
+    Raises:
+        ValueError: If the motifs differ in length or contain invalid DNA characters.
+
+    Example:
+        >>> ProfileMatrix(["ATG", "ACG", "AAG", "AGG", "ATG"])
+        array([[1. , 0.2, 0. ],
+               [0. , 0.2, 0. ],
+               [0. , 0.2, 1. ],
+               [0. , 0.4, 0. ]])
+    """
+    codes = Motifs if isinstance(Motifs, np.ndarray) else _motif_matrix(Motifs)
+    return CountMatrix(codes, pseudocount) / (len(codes) + 4 * pseudocount)
+
+def Count(Motifs: list[str | PackedGenome]) -> dict[str, list[int]]:
     """
     Counts the occurrences of each nucleotide at every position in a list of motifs.
 
@@ -9,30 +96,19 @@ def Count(Motifs: list[str]) -> dict[str, list[int]]:
     (A, C, G, or T) appears in position `j` across all motifs.
 
     Args:
-        Motifs (list[str]): A list of DNA strings (motifs) of equal length.
+        Motifs (list[str | PackedGenome]): A list of DNA strings (motifs) of equal length.
 
     Returns:
         dict[str, list[int]]: A dictionary with keys 'A', 'C', 'G', 'T', and values as lists of counts for each position.
 
     Example:
         >>> Count(["ATG", "ACG", "AAG", "AGG", "ATG"])
-        {'A': [5, 0, 0],
+        {'A': [5, 1, 0],
          'C': [0, 1, 0],
          'G': [0, 1, 5],
-         'T': [0, 3, 0]}
+         'T': [0, 2, 0]}
     """
-    count = {}
-    k = len(Motifs[0])
-    for symbol in "ACGT":
-        count[symbol] = []
-        for j in range(k):
-             count[symbol].append(0)
-    t = len(Motifs)
-    for i in range(t):
-        for j in range(k):
-            symbol = Motifs[i][j]
-            count[symbol][j] += 1
-    return count
+    return _matrix_dict(CountMatrix(Motifs))
 
 def Profile(Motifs: list[str]) -> dict[str, list[float]]:
     """
@@ -51,19 +127,12 @@ def Profile(Motifs: list[str]) -> dict[str, list[float]]:
 
     Example:
         >>> Profile(["ATG", "ACG", "AAG", "AGG", "ATG"])
-        {'A': [1.0, 0.0, 0.0],
+        {'A': [1.0, 0.2, 0.0],
          'C': [0.0, 0.2, 0.0],
          'G': [0.0, 0.2, 1.0],
-         'T': [0.0, 0.6, 0.0]}
+         'T': [0.0, 0.4, 0.0]}
     """
-    t = len(Motifs)
-    k = len(Motifs[0])
-    profile = {}
-    profile = Count(Motifs)
-    for i in profile:
-        for j in range(k):
-            profile[i][j]/=t
-    return profile
+    return _matrix_dict(ProfileMatrix(Motifs))
 
 def Consensus(Motifs: list[str]) -> str:
     """
@@ -82,20 +151,10 @@ def Consensus(Motifs: list[str]) -> str:
         >>> Consensus(["ATG", "ACG", "AAG", "AGG", "ATG"])
         'ATG'
     """
-    k = len(Motifs[0])
-    count = Count(Motifs)
-    consensus = ""
-    for j in range(k):
-        m = 0
-        frequentSymbol = ""
-        for symbol in "ACGT":
-            if count[symbol][j] > m:
-                m = count[symbol][j]
-                frequentSymbol = symbol
-        consensus += frequentSymbol
-    return consensus
+    # argmax keeps the first symbol in 'ACGT' order on ties
+    return "".join("ACGT"[symbol] for symbol in CountMatrix(Motifs).argmax(axis=0).tolist())
 
-def Score(Motifs: list[str]) -> int:
+def Score(Motifs: list[str | PackedGenome]) -> int:
     """
     Calculates the total score of a set of motifs based on their similarity to the consensus.
 
@@ -103,7 +162,7 @@ def Score(Motifs: list[str]) -> int:
     A lower score indicates a more conserved motif set, while a higher score indicates greater variability.
 
     Args:
-        Motifs (list[str]): A list of DNA strings (motifs) of equal length.
+        Motifs (list[str | PackedGenome]): A list of DNA strings (motifs) of equal length.
 
     Returns:
         int: The total number of mismatches compared to the consensus across all positions and motifs.
@@ -112,17 +171,9 @@ def Score(Motifs: list[str]) -> int:
         >>> Score(["ATG", "ACG", "AAG", "AGG", "ATG"])
         3
     """
-    consensus=Consensus(Motifs)
-    score = 0
-    k = len(Motifs[0])
-    t = len(Motifs)
-    for i in range(t):
-        for j in range(k):
-            if Motifs[i][j] != consensus[j]:
-                score += 1
-    return score
+    return _score_counts(CountMatrix(Motifs))
 
-def Pr(Text: str, Profile: dict[str, list[float]]) -> float:
+def Pr(Text: str | PackedGenome, Profile: dict[str, list[float]]) -> float:
     """
     Computes the probability of a DNA string given a profile matrix.
 
@@ -131,7 +182,7 @@ def Pr(Text: str, Profile: dict[str, list[float]]) -> float:
     probabilities from the profile for each nucleotide at each position.
 
     Args:
-        Text (str): A DNA string (motif) of length k.
+        Text (str | PackedGenome): A DNA string (motif) of length k.
         Profile (dict[str, list[float]]): A profile matrix containing nucleotide probabilities at each position, with keys 'A', 'C', 'G', 'T'.
 
     Returns:
@@ -147,12 +198,51 @@ def Pr(Text: str, Profile: dict[str, list[float]]) -> float:
         >>> Pr("ACG", profile)
         0.2 * 0.3 * 0.4 = 0.024
     """
+    if isinstance(Text, PackedGenome):
+        Text = ["ACGT"[code] for code in Text.codes().tolist()]
     p = 1
     for i in range(len(Text)):
         p=p*Profile[Text[i]][i]
     return p
 
-def ProfileMostProbableKmer(text: str, k: int, profile: dict[str, list[float]]) -> str:
+def _profile_matrix(profile: dict[str, list[float]] | np.ndarray) -> np.ndarray:
+    """Returns a profile as a 4 x k float64 array with rows in 'ACGT' order."""
+    if isinstance(profile, np.ndarray):
+        return profile.astype(np.float64, copy=False)
+    return np.array([profile[symbol] for symbol in "ACGT"], dtype=np.float64)
+
+def _window_probabilities(codes: np.ndarray, k: int, matrix: np.ndarray) -> np.ndarray:
+    """Returns the probability of every k-mer of a code array under a 4 x k profile."""
+    n = len(codes) - k + 1
+    # multiply in the same left-to-right order as Pr() so ties resolve identically
+    probabilities = np.ones(n)
+    for j in range(k):
+        probabilities *= matrix[codes[j:j + n], j]
+    return probabilities
+
+def _most_probable_index(codes: np.ndarray, k: int, matrix: np.ndarray) -> int:
+    """Returns the leftmost start of the most probable k-mer of a code array under a 4 x k profile."""
+    return int(_window_probabilities(codes, k, matrix).argmax())
+
+def _profile_random_index(codes: np.ndarray, k: int, matrix: np.ndarray, rng: np.random.Generator | None = None, size: int | None = None) -> int | np.ndarray:
+    """
+    Draws k-mer start positions of a code array with probability proportional to their profile 
+    probability, by binary search of uniform draws in the cumulative probabilities.
+    """
+    cumulative = np.cumsum(_window_probabilities(codes, k, matrix))
+    total = cumulative[-1]
+    if not total > 0:
+        raise ValueError("Every k-mer of the text has probability 0 under the profile.")
+    if rng is not None:
+        draws = rng.random(size)
+    elif size is None:
+        draws = random.uniform(0, 1)
+    else:
+        draws = np.array([random.uniform(0, 1) for _ in range(size)])
+    indices = np.minimum(np.searchsorted(cumulative, draws * total, side="right"), len(cumulative) - 1)
+    return indices if size is not None else int(indices)
+
+def ProfileMostProbableKmer(text: str | PackedGenome, k: int, profile: dict[str, list[float]]) -> str:
     """
     Finds the most probable k-mer in a DNA sequence based on a given profile matrix.
 
@@ -162,7 +252,7 @@ def ProfileMostProbableKmer(text: str, k: int, profile: dict[str, list[float]])
     the function returns the first one that occurs in `text`.
 
     Args:
-        text (str): The DNA sequence to search within.
+        text (str | PackedGenome): The DNA sequence to search within.
         k (int): The length of the k-mers.
         profile (dict[str, list[float]]): A profile matrix containing nucleotide probabilities at each position (keys: 'A', 'C', 'G', 'T').
 
@@ -180,17 +270,281 @@ def ProfileMostProbableKmer(text: str, k: int, profile: dict[str, list[float]])
         >>> ProfileMostProbableKmer(text, 5, profile)
         'CCGAG'
     """
-    most_probable=""
-    most_probable_value=-1
-    for i in range(len(text)-k+1):
-        k_mer=text[i:(i+k)]
-        k_mer_probability=Pr(k_mer, profile)
-        if(k_mer_probability > most_probable_value):
-            most_probable_value = k_mer_probability
-            most_probable = k_mer
-    return most_probable
+    if len(text) < k:
+        return ""
+    i = _most_probable_index(_as_codes(text), k, _profile_matrix(profile))
+    return _as_str(text[i:i + k])
+
+_COMPLEMENT_CODES = np.array([3, 2, 1, 0, 4], dtype=np.uint8)
+
+def _window_log_scores(codes: np.ndarray, log_matrix: np.ndarray, reverse: bool = False, block_size: int = 1 << 20):
+    """
+    Scores every window of a code array against a 5 x k log-probability matrix (row 4 for 
+    invalid symbols) by gathering one column at a time, yielding (first window, scores) per block. 
+    With `reverse`, column j is matched against the j-th symbol from the end of each window.
+    """
+    k = log_matrix.shape[1]
+    windows = len(codes) - k + 1
+    for start in range(0, max(windows, 0), block_size):
+        stop = min(start + block_size, windows)
+        scores = np.zeros(stop - start)
+        for j in range(k):
+            offset = k - 1 - j if reverse else j
+            scores += log_matrix[codes[start + offset:stop + offset], j]
+        yield start, scores
+
+def _best_hits(positions: list[np.ndarray], signs: list[np.ndarray], scores: list[np.ndarray], limit: int) -> tuple[list[np.ndarray], list[np.ndarray], list[np.ndarray]]:
+    """Merges the collected hits and keeps the `limit` best ones (ties broken by position, then strand)."""
+    positions, signs, scores = (np.concatenate(values) for values in (positions, signs, scores))
+    order = np.lexsort((signs, positions, -scores))[:limit]
+    return [positions[order]], [signs[order]], [scores[order]]
+
+def ScanProfile(Text: str | PackedGenome, profile: dict[str, list[float]] | np.ndarray, top: int | None = None, threshold: float | None = None, reverse_complement: bool = False) -> list[tuple[int, str, float]]:
+    """
+    Scores every k-mer of a sequence against a profile matrix and reports the best windows.
+
+    The profile is converted once into a matrix of natural log-probabilities, and the score 
+    of every window is built with k vectorized gather-and-add passes over the whole sequence 
+    (block by block), instead of calling `Pr()` on a new slice at every position. Working 
+    with log-probabilities avoids the underflow of long products. Windows containing a 
+    symbol other than uppercase 'A', 'C', 'G' or 'T' (lowercase bases included) score -inf, 
+    as they count as mismatches in the pattern matching functions.
+
+    With `reverse_complement`, the reverse strand is scanned with the reverse-complemented 
+    profile, and a '-' hit at position i means that the reverse complement of Text[i:i+k] 
+    matches the profile.
+
+    Args:
+        Text (str | PackedGenome): The DNA sequence to scan.
+        profile (dict[str, list[float]] | np.ndarray): A profile matrix, either as a dictionary 
+            with keys 'A', 'C', 'G', 'T' or as a 4 x k array with rows in that order.
+        top (int | None, optional): Report the `top` highest-scoring windows. Default is None.
+        threshold (float | None, optional): Report the windows whose log-probability is at least 
+            `threshold`. Default is None. If neither `top` nor `threshold` is given, only the 
+            single best window is reported.
+        reverse_complement (bool, optional): Scan both strands. Default is False.
+
+    Returns:
+        list[tuple[int, str, float]]: Hits as (position, strand, log-probability) tuples, strand 
+        being '+' or '-'. Top-N hits are ordered by decreasing score (ties broken by position, 
+        '+' first); threshold hits are in the same order when `top` is also given and in 
+        position order otherwise.
+
+    Example:
+        >>> profile = {
+        ...     'A': [0.2, 0.2, 0.3, 0.2, 0.3],
+        ...     'C': [0.4, 0.3, 0.1, 0.5, 0.1],
+        ...     'G': [0.3, 0.3, 0.5, 0.2, 0.4],
+        ...     'T': [0.1, 0.2, 0.1, 0.1, 0.2]
+        ... }
+        >>> text = "ACCTGTTTATTGCCTAAGTTCCGAACAAACCCAATATAGCCCGAGGGCCT"
+        >>> ScanProfile(text, profile, top=2)
+        [(40, '+', -5.339139361068292), (20, '+', -5.626821433520073)]
+    """
+    matrix = _profile_matrix(profile)
+    codes = _scan_codes(Text)
+    with np.errstate(divide="ignore"):
+        log_matrix = np.vstack((np.log(matrix), np.full((1, matrix.shape[1]), -np.inf)))
+    strands = [("+", log_matrix)]
+    if reverse_complement:
+        # column j of the reverse strand reads the complement (3 - b) of the j-th base from the window end
+        strands.append(("-", np.vstack((log_matrix[3::-1], log_matrix[4:]))))
+    limit = 1 if top is None and threshold is None else top
+    positions, signs, scores = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int8)], [np.empty(0)]
+    for sign, (_, strand_matrix) in enumerate(strands):
+        for start, block in _window_log_scores(codes, strand_matrix, reverse=sign == 1):
+            keep = np.ones(len(block), dtype=bool) if threshold is None else block >= threshold
+            if limit is not None and np.count_nonzero(keep) > limit:
+                # keep every window tying with the limit-th best score, so ties can be resolved by position
+                cutoff = np.partition(block[keep], -limit)[-limit]
+                keep &= block >= cutoff
+            positions.append(np.flatnonzero(keep) + start)
+            signs.append(np.full(np.count_nonzero(keep), sign, dtype=np.int8))
+            scores.append(block[keep])
+            if limit is not None:
+                positions, signs, scores = _best_hits(positions, signs, scores, limit)
+    positions, signs, scores = (np.concatenate(values) for values in (positions, signs, scores))
+    if limit is None:
+        order = np.lexsort((signs, positions))
+    else:
+        order = np.lexsort((signs, positions, -scores))[:limit]
+    return [(position, strands[sign][0], score) for position, sign, score in zip(positions[order].tolist(), signs[order].tolist(), scores[order].tolist())]
+
+class PWM:
+    """
+    Compiled log-odds position weight matrix for fast threshold scans.
+
+    The profile probabilities are converted once into log2 odds against background base 
+    frequencies, so the score of a k-mer is a sum instead of a product and does not underflow 
+    for long motifs (a zero probability gives -inf). The columns are evaluated from the most to 
+    the least informative, and the best score still reachable from each column onward (the 
+    suffix sum of the column maxima) is precomputed, so a threshold scan drops a window as soon 
+    as its partial score plus that bound falls below the threshold. All scores, including those 
+    of `score()`, `max_score` and the bounds, add the columns in that same order, so the best 
+    k-mer scores exactly `max_score`; threshold comparisons also allow a relative slack of 1e-9 
+    so rounding never drops a window that reaches the threshold.
+
+    Attributes:
+        k (int): Length of the motif.
+        log_odds (np.ndarray): 4 x k float64 log2-odds matrix, rows in 'ACGT' order.
+        background (np.ndarray): Background frequencies of 'A', 'C', 'G', 'T'.
+        order (np.ndarray): Column evaluation order, most informative column first.
+        suffix_max (np.ndarray): suffix_max[j] is the best total of the columns order[j:], taken 
+            as `max_score` minus the best total of the columns order[:j].
 
-def GreedyMotifSearch(Dna: list[str], k: int, t: int) -> list[str]:
+    Example:
+        >>> pwm = PWM(ProfileWithPseudocounts(["AACGTA", "CCCGTT", "CACCTT", "GGATTA", "TTCCGG"]))
+        >>> pwm.max_score
+        3.9641561840054758
+        >>> pwm.scan("CACGTTGGACCCGTTA", threshold=2.0)
+        [(0, '+', 3.9641561840054758), (9, '+', 3.3791936832843192)]
+    """
+
+    def __init__(self, profile: dict[str, list[float]] | np.ndarray, background: dict[str, float] | list[float] | None = None) -> None:
+        matrix = _profile_matrix(profile)
+        if background is None:
+            background = [0.25] * 4
+        elif isinstance(background, dict):
+            background = [background[symbol] for symbol in "ACGT"]
+        self.k = matrix.shape[1]
+        self.background = np.array(background, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            self.log_odds = np.log2(matrix) - np.log2(self.background)[:, None]
+        self.order = np.argsort(-(self.log_odds.max(axis=0) - self.log_odds.min(axis=0)), kind="stable")
+        # np.cumsum adds left to right, in the same order as the scans
+        prefix_max = np.concatenate(([0.0], np.cumsum(self.log_odds.max(axis=0)[self.order])))
+        self.suffix_max = prefix_max[-1] - prefix_max
+        # row 4 scores symbols other than 'A', 'C', 'G', 'T'
+        self._columns = np.ascontiguousarray(np.vstack((self.log_odds, np.full((1, self.k), -np.inf))).T)
+
+    def __repr__(self) -> str:
+        return f"PWM(k={self.k}, max_score={self.max_score:.3f})"
+
+    @property
+    def max_score(self) -> float:
+        """The highest score any k-mer can reach."""
+        return float(self.suffix_max[0])
+
+    @property
+    def min_score(self) -> float:
+        """The lowest score any k-mer can reach."""
+        return float(np.cumsum(self.log_odds.min(axis=0)[self.order])[-1]) if self.k else 0.0
+
+    def score(self, kmer: str | PackedGenome) -> float:
+        """Returns the log-odds score of a k-mer (-inf if it contains a symbol other than uppercase 'A', 'C', 'G', 'T')."""
+        codes = _scan_codes(kmer)
+        if len(codes) != self.k:
+            raise ValueError("The k-mer length does not match the PWM.")
+        total = 0.0
+        for j in self.order.tolist():
+            total += self._columns[j, codes[j]]
+        return float(total)
+
+    def scores(self, Text: str | PackedGenome, reverse_complement: bool = False) -> np.ndarray:
+        """Returns the score of every window of a sequence (of its reverse complement with `reverse_complement`)."""
+        codes = _scan_codes(Text)
+        return self._window_scores(codes, 0, max(len(codes) - self.k + 1, 0), None, reverse_complement)[1]
+
+    def _window_scores(self, codes: np.ndarray, first: int, stop: int, threshold: float | None, reverse: bool) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Scores the windows starting at first..stop-1 column by column, dropping those that can 
+        no longer reach `threshold`, and returns the surviving starts with their scores.
+        """
+        starts = None
+        scores = np.zeros(stop - first)
+        # a little slack so rounding never drops a window reaching the threshold exactly
+        lowest = None if threshold is None else threshold - 1e-9 * max(1.0, abs(threshold))
+        for step, j in enumerate(self.order.tolist()):
+            offset = self.k - 1 - j if reverse else j
+            # contiguous slices while every window is alive, gathers once some were dropped
+            symbols = codes[first + offset:stop + offset] if starts is None else codes[starts + offset]
+            if reverse:
+                # the reverse strand reads the complement of the j-th base from the window end
+                symbols = _COMPLEMENT_CODES[symbols]
+            scores += self._columns[j].take(symbols)
+            if threshold is not None:
+                alive = scores + self.suffix_max[step + 1] >= lowest
+                if not alive.all():
+                    starts = np.flatnonzero(alive) + first if starts is None else starts[alive]
+                    scores = scores[alive]
+        if starts is None:
+            starts = np.arange(first, stop)
+        if threshold is not None:
+            keep = scores >= lowest
+            starts, scores = starts[keep], scores[keep]
+        return starts, scores
+
+    def scan(self, Text: str | PackedGenome, threshold: float, reverse_complement: bool = False, block_size: int = 1 << 20) -> list[tuple[int, str, float]]:
+        """
+        Finds every window of a sequence scoring at least `threshold`.
+
+        Args:
+            Text (str | PackedGenome): The DNA sequence to scan.
+            threshold (float): Minimum log-odds score of a hit.
+            reverse_complement (bool, optional): Also scan the reverse strand. Default is False.
+            block_size (int, optional): Number of windows scored per vectorized block. Default is 1,048,576.
+
+        Returns:
+            list[tuple[int, str, float]]: Hits as (position, strand, score) tuples in position 
+            order, strand being '+' or '-' ('+' first at the same position).
+        """
+        codes = _scan_codes(Text)
+        windows = len(codes) - self.k + 1
+        hits = []
+        for start in range(0, max(windows, 0), block_size):
+            stop = min(start + block_size, windows)
+            found = [(*self._window_scores(codes, start, stop, threshold, False), "+")]
+            if reverse_complement:
+                found.append((*self._window_scores(codes, start, stop, threshold, True), "-"))
+            block = [(position, strand, score) for positions, scores, strand in found for position, score in zip(positions.tolist(), scores.tolist())]
+            hits.extend(sorted(block, key=lambda hit: (hit[0], hit[1] == "-")))
+        return hits
+
+def _greedy_seeds(codes: list[np.ndarray], k: int, pseudocount: int, seeds: range) -> tuple[int, int, list[int]] | None:
+    """
+    Runs the greedy motif search for a range of seed positions in the first sequence and 
+    returns (score, seed, motif start positions) of the first best-scoring seed, or None.
+    """
+    t = len(codes)
+    columns = np.arange(k)
+    best = None
+    for i in seeds:
+        counts = np.zeros((4, k), dtype=np.int64)
+        counts[codes[0][i:i + k], columns] += 1
+        starts = [i]
+        for j in range(1, t):
+            # the count matrix grows by one motif per step instead of being rebuilt
+            profile = (counts + pseudocount) / (j + 4 * pseudocount)
+            start = _most_probable_index(codes[j], k, profile)
+            starts.append(start)
+            counts[codes[j][start:start + k], columns] += 1
+        score = _score_counts(counts)
+        if best is None or score < best[0]:
+            best = (score, i, starts)
+    return best
+
+def _greedy_motif_search(Dna: list[str | PackedGenome], k: int, t: int, pseudocount: int, processes: int) -> list[str]:
+    """Shared implementation of `GreedyMotifSearch()` and `GreedyMotifSearchWithPseudocounts()`."""
+    Dna = Dna[:t]
+    codes = [_as_codes(Text) for Text in Dna]
+    BestMotifs = [_as_str(Text[0:k]) for Text in Dna]
+    best_score = Score(BestMotifs)
+    seeds = len(Dna[0]) - k + 1
+    if processes <= 1 or seeds < 2 * processes:
+        results = [_greedy_seeds(codes, k, pseudocount, range(seeds))]
+    else:
+        step = -(-seeds // processes)
+        ranges = [range(start, min(start + step, seeds)) for start in range(0, seeds, step)]
+        with ProcessPoolExecutor(processes) as pool:
+            results = list(pool.map(_greedy_seeds, [codes] * len(ranges), [k] * len(ranges), [pseudocount] * len(ranges), ranges))
+    # ranges are in seed order and only strict improvements count, so the leftmost best seed wins
+    for result in results:
+        if result is not None and result[0] < best_score:
+            best_score, _, starts = result
+            BestMotifs = [_as_str(Text[start:start + k]) for Text, start in zip(Dna, starts)]
+    return BestMotifs
+
+def GreedyMotifSearch(Dna: list[str | PackedGenome], k: int, t: int, processes: int = 1) -> list[str]:
     """
     Finds the best-scoring collection of motifs across multiple DNA strings using the greedy motif search algorithm.
 
@@ -202,16 +556,22 @@ def GreedyMotifSearch(Dna: list[str], k: int, t: int) -> list[str]:
     most probable k-mer according to that profile. The score of the resulting motif set is compared to the 
     current best, and updated if an improvement is found.
 
+    The count matrix behind the profile is updated as each motif is added rather than rebuilt from 
+    all previous motifs, and the best score is kept instead of being recomputed. With `processes` 
+    greater than 1, the seed k-mers of the first string are split into ranges searched on a process pool.
+
     Args:
-        Dna (list[str]): A list of `t` DNA strings (all of equal length).
+        Dna (list[str | PackedGenome]): A list of `t` DNA strings (all of equal length).
         k (int): The length of the motif to search for.
         t (int): The number of DNA strings.
+        processes (int, optional): Number of worker processes. Default is 1 (no pool).
 
     Returns:
         list[str]: A list of `t` k-mers (one from each string), representing the best motif set found.
 
     Notes:
-        - In case of ties in the profile-most probable k-mer selection, the leftmost occurrence is chosen.
+        - In case of ties in the profile-most probable k-mer selection, the leftmost occurrence is chosen, 
+          and among equally scoring motif sets the one from the leftmost seed is kept.
         - This basic version does not include pseudocounts; therefore, the presence of zeroes in the profile matrix 
           can suppress potential motifs. A pseudocount-enhanced version is more robust.
 
@@ -228,21 +588,7 @@ def GreedyMotifSearch(Dna: list[str], k: int, t: int) -> list[str]:
         >>> GreedyMotifSearch(Dna, k, t)
         ['CAG', 'CAG', 'CAA', 'CAA', 'CAA']
     """
-    BestMotifs = []
-    for i in range(0, t):
-        BestMotifs.append(Dna[i][0:k])
-        
-    n = len(Dna[0])
-    for i in range(n-k+1):
-        Motifs = []
-        Motifs.append(Dna[0][i:i+k])
-        for j in range(1, t):
-            P = Profile(Motifs[0:j])
-            Motifs.append(ProfileMostProbableKmer(Dna[j], k, P))
-        if Score(Motifs) < Score(BestMotifs):
-                BestMotifs = Motifs
-            
-    return BestMotifs
+    return _greedy_motif_search(Dna, k, t, 0, processes)
 
 def CountWithPseudocounts(Motifs: list[str]) -> dict[str, list[int]]:
     """
@@ -270,6 +616,7 @@ def CountWithPseudocounts(Motifs: list[str]) -> dict[str, list[int]]:
             'T': [2, 2, 1, 2, 5, 3]
         }
     """
+    return _matrix_dict(CountMatrix(Motifs, pseudocount=1))
 
 def ProfileWithPseudocounts(Motifs: list[str]) -> dict[str, list[float]]:
     """
@@ -300,16 +647,9 @@ def ProfileWithPseudocounts(Motifs: list[str]) -> dict[str, list[float]]:
             'T': [0.222, 0.222, 0.111, 0.222, 0.556, 0.333]
         }
     """
-    t = len(Motifs)
-    k = len(Motifs[0])
-    profile = {}
-    profile = CountWithPseudocounts(Motifs)
-    for i in profile:
-        for j in range(k):
-            profile[i][j]/=(t+4)
-    return profile
+    return _matrix_dict(ProfileMatrix(Motifs, pseudocount=1))
 
-def GreedyMotifSearchWithPseudocounts(Dna: list[str], k: int, t: int) -> list[str]:
+def GreedyMotifSearchWithPseudocounts(Dna: list[str | PackedGenome], k: int, t: int, processes: int = 1) -> list[str]:
     """
     Executes the greedy motif search algorithm using a pseudocount-corrected profile matrix.
 
@@ -318,10 +658,14 @@ def GreedyMotifSearchWithPseudocounts(Dna: list[str], k: int, t: int) -> list[st
     string, then explores all possible k-mers in the first DNA string, building a motif matrix 
     by iteratively adding the profile-most probable k-mer from the remaining strings.
 
+    As in `GreedyMotifSearch()`, the counts are updated incrementally and the seeds can be 
+    searched on a process pool.
+
     Args:
-        Dna (list[str]): A list of `t` DNA strings (assumed to be of equal or similar length).
+        Dna (list[str | PackedGenome]): A list of `t` DNA strings (assumed to be of equal or similar length).
         k (int): Length of the motif to identify.
         t (int): Number of DNA strings in the input list.
+        processes (int, optional): Number of worker processes. Default is 1 (no pool).
 
     Returns:
         list[str]: A list of `t` k-mers (one from each string) representing the highest scoring motifs.
@@ -336,23 +680,9 @@ def GreedyMotifSearchWithPseudocounts(Dna: list[str], k: int, t: int) -> list[st
         >>> GreedyMotifSearchWithPseudocounts(Dna, 3, 5)
         ['TTC', 'ATC', 'TTC', 'ATC', 'TTC']
     """
-    BestMotifs = []
-    for i in range(0, t):
-        BestMotifs.append(Dna[i][0:k])
-        
-    n = len(Dna[0])
-    for i in range(n-k+1):
-        Motifs = []
-        Motifs.append(Dna[0][i:i+k])
-        for j in range(1, t):
-            P = ProfileWithPseudocounts(Motifs[0:j])
-            Motifs.append(ProfileMostProbableKmer(Dna[j], k, P))
-        if Score(Motifs) < Score(BestMotifs):
-                BestMotifs = Motifs
-            
-    return BestMotifs
+    return _greedy_motif_search(Dna, k, t, 1, processes)
 
-def Motifs(Profile: dict[str, list[float]], Dna: list[str]) -> list[str]:
+def Motifs(Profile: dict[str, list[float]], Dna: list[str | PackedGenome]) -> list[str]:
     """
     Identifies the profile-most probable motif (k-mer) in each DNA string from a given profile matrix.
 
@@ -363,7 +693,7 @@ def Motifs(Profile: dict[str, list[float]], Dna: list[str]) -> list[str]:
     Args:
         Profile (dict[str, list[float]]): A profile matrix represented as a dictionary 
             mapping nucleotides ('A', 'C', 'G', 'T') to lists of positional probabilities.
-        Dna (list[str]): A list of `t` DNA strings (assumed to be of equal or similar length).
+        Dna (list[str | PackedGenome]): A list of `t` DNA strings (assumed to be of equal or similar length).
 
     Returns:
         list[str]: A list of k-mers (motifs), one from each input string, representing the 
@@ -388,7 +718,13 @@ def Motifs(Profile: dict[str, list[float]], Dna: list[str]) -> list[str]:
         Motifs.append(ProfileMostProbableKmer(Dna[j], k, P))
     return Motifs
 
-def RandomMotifs(Dna: list[str], k: int, t: int) -> list[str]:
+def _random_starts(Dna: list[str | PackedGenome], k: int, t: int, rng: np.random.Generator | None = None) -> list[int]:
+    """Draws a random k-mer start position in each of the first t DNA strings, with `rng` or the `random` module."""
+    if rng is not None:
+        return [int(rng.integers(len(Dna[j]) - k + 1)) for j in range(0, t)]
+    return [random.randint(0, len(Dna[j])-k) for j in range(0, t)]
+
+def RandomMotifs(Dna: list[str | PackedGenome], k: int, t: int, rng: np.random.Generator | None = None) -> list[str]:
     """
     Randomly selects one k-mer motif from each DNA string in the input list.
 
@@ -398,9 +734,11 @@ def RandomMotifs(Dna: list[str], k: int, t: int) -> list[str]:
     from that position.
 
     Args:
-        Dna (list[str]): A list of `t` DNA strings (assumed to be of equal or similar length).
+        Dna (list[str | PackedGenome]): A list of `t` DNA strings (assumed to be of equal or similar length).
         k (int): Length of the motif to select.
         t (int): Number of DNA strings to process (usually len(Dna)).
+        rng (np.random.Generator | None, optional): Random generator used for the draws. 
+            Default is None, which uses the `random` module.
 
     Returns:
         list[str]: A list of `t` randomly chosen k-mers (one from each DNA string).
@@ -410,14 +748,9 @@ def RandomMotifs(Dna: list[str], k: int, t: int) -> list[str]:
         >>> RandomMotifs(Dna, 3, 5)
         ['ACC', 'GAT', 'TAG', 'TAA', 'AGA']
     """
-    Motifs = []
-    for j in range(0, t):
-        r=random.randint(0, len(Dna[j])-k)
-        Motifs.append(Dna[j][r:r+k])
-    
-    return Motifs
+    return [_as_str(Dna[j][r:r+k]) for j, r in enumerate(_random_starts(Dna, k, t, rng))]
 
-def RandomizedMotifSearch(Dna: list[str], k: int, t: int) -> list[str]:
+def RandomizedMotifSearch(Dna: list[str | PackedGenome], k: int, t: int, rng: np.random.Generator | None = None) -> list[str]:
     """
     Performs the Randomized Motif Search algorithm to identify conserved k-mers across DNA sequences.
 
@@ -431,10 +764,15 @@ def RandomizedMotifSearch(Dna: list[str], k: int, t: int) -> list[str]:
     and often outperforms deterministic approaches like greedy motif search, especially when repeated 
     many times from different random initializations.
 
+    The motifs are tracked as start positions in the encoded sequences, and the best score is kept 
+    rather than recomputed at every comparison.
+
     Args:
-        Dna (list[str]): A list of `t` DNA strings.
+        Dna (list[str | PackedGenome]): A list of `t` DNA strings.
         k (int): Length of the motifs to find.
         t (int): Number of DNA strings to process.
+        rng (np.random.Generator | None, optional): Random generator used for the initial motifs. 
+            Default is None, which uses the `random` module.
 
     Returns:
         list[str]: A list of `t` k-mers representing the best-scoring motifs found.
@@ -455,16 +793,19 @@ def RandomizedMotifSearch(Dna: list[str], k: int, t: int) -> list[str]:
         - For more reliable results, run the function multiple times and retain the best output.
         - Uses pseudocounts in profile construction to avoid zero probabilities.
     """
-    M = RandomMotifs(Dna, k, t)
-    BestMotifs = M
-    
+    codes = [_as_codes(Text) for Text in Dna[:t]]
+    starts = _random_starts(Dna, k, t, rng)
+    counts = CountMatrix(np.array([text[start:start + k] for text, start in zip(codes, starts)]))
+    BestStarts, best_score = starts, _score_counts(counts)
     while True:
-        Profile = ProfileWithPseudocounts(M)
-        M = Motifs(Profile, Dna)
-        if Score(M) < Score(BestMotifs):
-            BestMotifs = M
+        profile = (counts + 1) / (t + 4)
+        starts = [_most_probable_index(text, k, profile) for text in codes]
+        counts = CountMatrix(np.array([text[start:start + k] for text, start in zip(codes, starts)]))
+        score = _score_counts(counts)
+        if score < best_score:
+            BestStarts, best_score = starts, score
         else:
-            return BestMotifs
+            return [_as_str(Dna[j][start:start + k]) for j, start in enumerate(BestStarts)]
         
 def Normalize(Probabilities: dict[str, float]) -> dict[str, float]:
     """
@@ -520,16 +861,17 @@ def WeightedDie(Probabilities: dict[str, float]) -> str:
         if p < sum:
             return kmer
         
-def ProfileGeneratedString(Text: str, profile: dict[str, list[float]], k: int) -> str:
+def ProfileGeneratedString(Text: str | PackedGenome, profile: dict[str, list[float]], k: int) -> str:
     """
     Selects a k-mer from the input string according to its probability based on a given profile.
 
     This function computes the probability of each k-mer of length `k` in `Text` based on 
-    a nucleotide position-specific profile matrix. It then normalizes these probabilities 
-    and randomly selects one k-mer using a weighted die (probabilistic sampling).
+    a nucleotide position-specific profile matrix. It then randomly selects one k-mer with 
+    probability proportional to its profile probability, using the `random` module. It is 
+    `ProfileRandomKmer()` with its default arguments.
 
     Args:
-        Text (str): The DNA string from which to extract the k-mer.
+        Text (str | PackedGenome): The DNA string from which to extract the k-mer.
         profile (dict[str, list[float]]): Profile matrix as a dictionary mapping nucleotides to lists of position-specific probabilities.
         k (int): Length of the k-mers to evaluate.
 
@@ -541,16 +883,45 @@ def ProfileGeneratedString(Text: str, profile: dict[str, list[float]], k: int) -
         >>> ProfileGeneratedString("AAACCCAAACCC", profile, 2)
         'AA'
     """
-    n = len(Text)
-    probabilities = {}
-    
-    for i in range(0,n-k+1):
-        probabilities[Text[i:i+k]] = Pr(Text[i:i+k], profile)
-        
-    probabilities = Normalize(probabilities)
-    return WeightedDie(probabilities)
+    return ProfileRandomKmer(Text, profile, k)
+
+def ProfileRandomKmer(Text: str | PackedGenome, profile: dict[str, list[float]] | np.ndarray, k: int, rng: np.random.Generator | None = None, size: int | None = None) -> str | list[str]:
+    """
+    Draws k-mers of a DNA string at random, each position weighted by its profile probability.
+
+    The probabilities of all k-mers are computed in k vectorized passes over the text and 
+    accumulated with `np.cumsum`; each draw is then a binary search of a uniform number in the 
+    cumulative probabilities, so drawing costs O(log n) after the O(n k) setup, and repeated 
+    k-mers are weighted by every position where they occur.
 
-def GibbsSampler(Dna: list[str], k: int, t: int, N: int) -> list[str]:
+    Args:
+        Text (str | PackedGenome): The DNA string from which to draw the k-mers.
+        profile (dict[str, list[float]] | np.ndarray): A profile matrix, either as a dictionary 
+            with keys 'A', 'C', 'G', 'T' or as a 4 x k array with rows in that order.
+        k (int): Length of the k-mers.
+        rng (np.random.Generator | None, optional): Random generator used for the draws. Default is 
+            None, which draws from the `random` module.
+        size (int | None, optional): Number of k-mers to draw. Default is None (a single k-mer).
+
+    Returns:
+        str | list[str]: The drawn k-mer, or a list of `size` k-mers ("" if the text is shorter than k).
+
+    Raises:
+        ValueError: If every k-mer of the text has probability 0 under the profile.
+
+    Example:
+        >>> profile = {'A': [0.5, 0.1], 'C': [0.3, 0.2], 'G': [0.2, 0.4], 'T': [0.0, 0.3]}
+        >>> ProfileRandomKmer("AAACCCAAACCC", profile, 2, rng=np.random.default_rng(0), size=3)
+        ['AA', 'AC', 'AA']
+    """
+    if len(Text) < k:
+        return "" if size is None else []
+    indices = _profile_random_index(_as_codes(Text), k, _profile_matrix(profile), rng, size)
+    if size is None:
+        return _as_str(Text[indices:indices + k])
+    return [_as_str(Text[i:i + k]) for i in indices.tolist()]
+
+def GibbsSampler(Dna: list[str | PackedGenome], k: int, t: int, N: int, sample: bool = False, rng: np.random.Generator | None = None) -> list[str]:
     """
     Implements the Gibbs Sampling algorithm for motif discovery in a set of DNA sequences.
 
@@ -559,11 +930,18 @@ def GibbsSampler(Dna: list[str], k: int, t: int, N: int) -> list[str]:
     This allows the algorithm to escape local optima and potentially find better solutions 
     than greedy or deterministic methods.
 
+    A running count matrix of the current motifs is kept, so each iteration only removes and 
+    re-adds the counts of the motif it replaces and rescores the motifs in O(k).
+
     Args:
-        Dna (list[str]): A list of DNA strings.
+        Dna (list[str | PackedGenome]): A list of DNA strings.
         k (int): The length of the motif to search for.
         t (int): The number of DNA strings (should be equal to len(Dna)).
         N (int): Number of iterations for the Gibbs sampling process.
+        sample (bool, optional): Replace each motif with a k-mer drawn by `ProfileRandomKmer()` 
+            instead of the profile-most probable k-mer. Default is False.
+        rng (np.random.Generator | None, optional): Random generator used for every random choice. 
+            Default is None, which uses the `random` module.
 
     Returns:
         list[str]: A list of `t` k-mers (one from each DNA string) representing the best motif set found.
@@ -579,15 +957,248 @@ def GibbsSampler(Dna: list[str], k: int, t: int, N: int) -> list[str]:
         >>> GibbsSampler(Dna, 8, 5, 100)
         ['TCTCGGGG', 'CCAAGGTG', 'TACAGGCG', 'TTCAGGTG', 'TCCACGTG']
     """
-    BestMotifs = []
-    Motifs = RandomMotifs(Dna, k, t)
-    BestMotifs = Motifs
+    codes = [_as_codes(Text) for Text in Dna[:t]]
+    columns = np.arange(k)
+    starts = _random_starts(Dna, k, t, rng)
+    counts = CountMatrix(np.array([text[start:start + k] for text, start in zip(codes, starts)]))
+    BestStarts, best_score = list(starts), _score_counts(counts)
     for j in range(N):
-        i = random.randint(1,t)
-        text=Motifs.pop(i-1)
-        profile=ProfileWithPseudocounts(Motifs)
-        kmer=ProfileMostProbableKmer(text, k, profile)
-        Motifs.insert(i-1, kmer)
-        if(Score(Motifs) < Score(BestMotifs)):
-            BestMotifs = Motifs
-    return BestMotifs
\ No newline at end of file
+        i = random.randint(1,t) if rng is None else int(rng.integers(1, t + 1))
+        # only the counts of the replaced motif change, so the profile and score are updated in O(k)
+        counts[codes[i-1][starts[i-1]:starts[i-1] + k], columns] -= 1
+        profile = (counts + 1) / (t - 1 + 4)
+        if sample:
+            starts[i-1] = _profile_random_index(codes[i-1], k, profile, rng)
+        else:
+            starts[i-1] = _most_probable_index(codes[i-1], k, profile)
+        counts[codes[i-1][starts[i-1]:starts[i-1] + k], columns] += 1
+        score = _score_counts(counts)
+        if score < best_score:
+            BestStarts, best_score = list(starts), score
+    return [_as_str(Dna[j][start:start + k]) for j, start in enumerate(BestStarts)]
+
+def _motif_search_batch(Dna: list[str], k: int, t: int, method: str, N: int, sample: bool, seeds: list[int], deadline: float | None = None) -> list[tuple[int, list[str]]]:
+    """
+    Runs one motif search per seed with its own NumPy generator and returns (score, motifs) pairs, 
+    skipping the remaining seeds once the wall-clock `deadline` (a `time.time()` value) has passed.
+    """
+    results = []
+    for seed in seeds:
+        if deadline is not None and time.time() >= deadline:
+            break
+        rng = np.random.default_rng(seed)
+        if method == "gibbs":
+            found = GibbsSampler(Dna, k, t, N, sample=sample, rng=rng)
+        else:
+            found = RandomizedMotifSearch(Dna, k, t, rng=rng)
+        results.append((Score(found), found))
+    return results
+
+def MotifSearchRestarts(Dna: list[str | PackedGenome], k: int, t: int, restarts: int, method: str = "randomized", N: int = 100, sample: bool = False, processes: int = 1, seed: int | None = None, time_budget: float | None = None, patience: int | None = None) -> dict:
+    """
+    Runs many independent starts of a randomized motif search and keeps the best motifs.
+
+    `RandomizedMotifSearch()` and `GibbsSampler()` only find good motifs when restarted many 
+    times from different random initializations. This function derives one seed per start 
+    from `seed` with `numpy.random.SeedSequence`, gives each start its own generator 
+    `np.random.default_rng(seed)` (the global `random` state is left untouched), and runs the 
+    starts in order (or in batches on a process pool), so a run is reproducible from `seed` and 
+    any single start can be replayed from its seed.
+
+    The run stops early once `time_budget` seconds have elapsed or the best score has not 
+    improved for `patience` consecutive starts. With a process pool, small batches of starts 
+    are submitted as earlier ones complete and their results are recorded in start order; the 
+    workers stop taking new starts once the time budget is spent, and the pool is shut down 
+    without waiting for the batches still running.
+
+    Args:
+        Dna (list[str | PackedGenome]): A list of `t` DNA strings.
+        k (int): Length of the motifs to find.
+        t (int): Number of DNA strings to process.
+        restarts (int): Maximum number of independent starts.
+        method (str, optional): "randomized" for `RandomizedMotifSearch()` or "gibbs" for 
+            `GibbsSampler()`. Default is "randomized".
+        N (int, optional): Number of iterations of each Gibbs sampler start. Default is 100.
+        sample (bool, optional): Run the Gibbs sampler in sampling mode (see `GibbsSampler()`). 
+            Default is False.
+        processes (int, optional): Number of worker processes. Default is 1 (no pool).
+        seed (int | None, optional): Seed of the whole run. Default is None (fresh entropy).
+        time_budget (float | None, optional): Wall-clock limit in seconds. Default is None.
+        patience (int | None, optional): Number of starts without improvement after which 
+            the run stops. Default is None.
+
+    Returns:
+        dict: A dictionary with the best `motifs` and their `score`, the `best_seed` that produced 
+        them, the `scores` and `seeds` of all completed starts in start order, the number of 
+        completed `restarts` and the `elapsed` wall-clock time in seconds.
+
+    Raises:
+        ValueError: If `method` is unknown or `restarts` is not positive.
+
+    Example:
+        >>> Dna = [
+        ...     "CGCCCCTCTCGGGGGTGTTCAGTAAACGGCCA",
+        ...     "GGGCGAGGTATGTGTAAGTGCCAAGGTGCCAG",
+        ...     "TAGTACCGAGACCGAAAGAAGTATACAGGCGT",
+        ...     "TAGATCAAGTTTCAGGTGCACGTCGGTGAACC",
+        ...     "AATCCACCAGCTCCACGTGCAATGTTGGCCTA"
+        ... ]
+        >>> result = MotifSearchRestarts(Dna, 8, 5, 1000, seed=0)
+        >>> result["motifs"], result["score"]
+        (['AACGGCCA', 'AAGTGCCA', 'TAGTACCG', 'AAGTTTCA', 'ACGTGCAA'], 9)
+    """
+    if method not in ("randomized", "gibbs"):
+        raise ValueError("method must be 'randomized' or 'gibbs'.")
+    if restarts < 1:
+        raise ValueError("restarts must be positive.")
+    Dna = [_as_str(Text) for Text in Dna]
+    seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(restarts)]
+    result = {"motifs": None, "score": None, "best_seed": None, "scores": [], "seeds": [], "restarts": 0, "elapsed": 0.0}
+    began = time.perf_counter()
+    stale = 0
+
+    def record(batch_seeds: list[int], found: list[tuple[int, list[str]]]) -> bool:
+        """Adds the results of a batch in start order and tells whether the run must stop."""
+        nonlocal stale
+        for start_seed, (score, motifs) in zip(batch_seeds, found):
+            result["scores"].append(score)
+            result["seeds"].append(start_seed)
+            if result["score"] is None or score < result["score"]:
+                result["motifs"], result["score"], result["best_seed"] = motifs, score, start_seed
+                stale = 0
+            else:
+                stale += 1
+                if patience is not None and stale >= patience:
+                    return True
+        return time_budget is not None and time.perf_counter() - began >= time_budget
+
+    if processes <= 1:
+        for start_seed in seeds:
+            if record([start_seed], _motif_search_batch(Dna, k, t, method, N, sample, [start_seed])):
+                break
+    else:
+        size = max(1, min(8, restarts // (8 * processes)))
+        batches = (seeds[i:i + size] for i in range(0, restarts, size))
+        deadline = None if time_budget is None else time.time() + time_budget
+        pool = ProcessPoolExecutor(processes)
+        try:
+            # only two batches per worker are in flight, so a stop never waits for queued work
+            pending = collections.deque()
+            while True:
+                for batch in itertools.islice(batches, 2 * processes - len(pending)):
+                    pending.append((batch, pool.submit(_motif_search_batch, Dna, k, t, method, N, sample, batch, deadline)))
+                if not pending:
+                    break
+                batch, future = pending.popleft()
+                remaining = None if time_budget is None else max(0.0, time_budget - (time.perf_counter() - began))
+                if not wait([future], timeout=remaining).done or record(batch, future.result()):
+                    break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    result["restarts"] = len(result["scores"])
+    result["elapsed"] = time.perf_counter() - began
+    return result
+
+def DistanceBetweenPatternAndStrings(Pattern: str, Dna: list[str | PackedGenome]) -> int:
+    """
+    Computes the total distance between a pattern and a collection of DNA strings.
+
+    The distance between `Pattern` and one string is the smallest Hamming distance between 
+    `Pattern` and any k-mer of that string; the distances to all strings are summed. Each 
+    string is compared with `HammingDistances()`, which evaluates all its windows at once.
+
+    Args:
+        Pattern (str): The pattern of length k.
+        Dna (list[str | PackedGenome]): The DNA strings, each at least k symbols long.
+
+    Returns:
+        int: The sum over all strings of the minimum Hamming distance to the pattern.
+
+    Example:
+        >>> DistanceBetweenPatternAndStrings("AAA", ["TTACCTTAAC", "GATATCTGTC", "ACGGCGTTCG", "CCCTAAAGAG", "CGTCAGAGGT"])
+        5
+    """
+    return sum(int(HammingDistances(Pattern, Text).min()) for Text in Dna)
+
+def _median_subtree(columns: np.ndarray, segments: np.ndarray, prefix: list[int], best: int) -> tuple[int, list[int] | None]:
+    """
+    Searches the patterns starting with `prefix` depth-first in lexicographic order, pruning every 
+    branch whose distance lower bound reaches `best`, and returns the best distance with its codes.
+    """
+    k = len(columns)
+    mismatches = np.zeros(columns.shape[1], dtype=np.uint8 if k < 256 else np.int32)
+    for depth, base in enumerate(prefix):
+        mismatches += columns[depth] != base
+    found = None
+    pattern = list(prefix) + [0] * (k - len(prefix))
+
+    def visit(depth: int, mismatches: np.ndarray) -> None:
+        nonlocal best, found
+        # a window never loses mismatches as the pattern grows, so the best window 
+        # of each string so far bounds the distance of every pattern below this node
+        bound = int(np.minimum.reduceat(mismatches, segments).sum(dtype=np.int64))
+        if bound >= best:
+            return
+        if depth == k:
+            best, found = bound, list(pattern)
+            return
+        for base in range(4):
+            pattern[depth] = base
+            visit(depth + 1, mismatches + (columns[depth] != base))
+
+    visit(len(prefix), mismatches)
+    return best, found
+
+def MedianString(Dna: list[str | PackedGenome], k: int, processes: int = 1) -> str:
+    """
+    Finds a k-mer minimizing the total distance to a collection of DNA strings (exact search).
+
+    Instead of evaluating all 4^k patterns, the patterns are explored as a prefix tree in 
+    lexicographic order. At each node, the mismatch counts of every window of every string 
+    against the current prefix are extended by one vectorized comparison, and the sum over 
+    the strings of their smallest count is a lower bound on `DistanceBetweenPatternAndStrings()` 
+    for every pattern in the subtree. Subtrees whose bound is not better than the best pattern 
+    found so far are skipped. With `processes` greater than 1, the subtrees below the first few 
+    bases are searched on a process pool.
+
+    The result is the exact optimum, which makes it a reference for the heuristic searches 
+    (`GreedyMotifSearch()`, `RandomizedMotifSearch()`, `GibbsSampler()`) on small k.
+
+    Args:
+        Dna (list[str | PackedGenome]): The DNA strings, each at least k symbols long.
+        k (int): Length of the pattern.
+        processes (int, optional): Number of worker processes. Default is 1 (no pool).
+
+    Returns:
+        str: The lexicographically first k-mer with the minimum total distance.
+
+    Raises:
+        ValueError: If a string is shorter than k or contains invalid DNA characters.
+
+    Example:
+        >>> MedianString(["AAATTGACGCAT", "GACGACCACGTT", "CGTCAGCGCCTG", "GCTGAGCACCGG", "AGTTCGGGACAG"], 3)
+        'GAC'
+    """
+    Dna = [_as_str(Text) for Text in Dna]
+    if k < 1 or any(len(Text) < k for Text in Dna):
+        raise ValueError("k must be positive and no longer than any string.")
+    codes = [_encode(Text) for Text in Dna]
+    # row j holds the base at offset j of every window of every string, strings one after another
+    columns = np.array([np.concatenate([text[j:len(text) - k + 1 + j] for text in codes]) for j in range(k)], dtype=np.uint8)
+    segments = np.cumsum([0] + [len(text) - k + 1 for text in codes[:-1]])
+    if processes <= 1:
+        best, found = _median_subtree(columns, segments, [], np.iinfo(np.int64).max)
+    else:
+        depth = 1
+        while depth < k and 4 ** depth < 4 * processes:
+            depth += 1
+        prefixes = [list(prefix) for prefix in itertools.product(range(4), repeat=depth)]
+        # an upper bound from the first subtree lets the other subtrees prune from the start
+        best, found = _median_subtree(columns, segments, prefixes[0], np.iinfo(np.int64).max)
+        with ProcessPoolExecutor(processes) as pool:
+            results = pool.map(_median_subtree, [columns] * (len(prefixes) - 1), [segments] * (len(prefixes) - 1), prefixes[1:], [best] * (len(prefixes) - 1))
+            # subtrees come back in lexicographic order and only strict improvements count
+            for distance, candidate in results:
+                if candidate is not None and distance < best:
+                    best, found = distance, candidate
+    return "".join("ACGT"[base] for base in found)
@@ -1,7 +1,23 @@
-from .basic import MinPositions
+import itertools
+import operator
+import os
+from collections.abc import Iterable, Iterator
+from typing import TextIO
 
+import numpy as np
 
-def PatternCount(Text: str, Pattern: str) -> int:
+from .basic import CountKmers, PackedGenome, _as_codes, _as_str, _decode_kmers, _encode, _iter_sequence_blocks_reversed, _merge_kmer_counts
+
+# symbol codes for scanning: A=0, C=1, G=2, T=3 and 4 for any other character
+_SCAN_CODES = np.full(256, 4, dtype=np.uint8)
+_SCAN_CODES[np.frombuffer(b"ACGT", dtype=np.uint8)] = np.arange(4, dtype=np.uint8)
+
+# translation table for Complement(): characters other than ACGT are deleted
+_COMPLEMENT = bytes.maketrans(b"ACGT", b"TGCA")
+_NON_ACGT = bytes(sorted(set(range(256)) - set(b"ACGT")))
+
+
+def PatternCount(Text: str | PackedGenome, Pattern: str) -> int:
     """
     Counts the number of exact occurrences of a pattern in a given DNA sequence.
 
@@ -9,7 +25,7 @@ def PatternCount(Text: str, Pattern: str) -> int:
     and counts how many times the exact pattern appears.
 
     Args:
-        Text (str): DNA sequence in which the pattern is searched.
+        Text (str | PackedGenome): DNA sequence in which the pattern is searched.
         Pattern (str): DNA pattern to find within the sequence.
 
     Returns:
@@ -19,74 +35,69 @@ def PatternCount(Text: str, Pattern: str) -> int:
         >>> PatternCount("ATATAT", "ATA")
         2
     """
+    if isinstance(Text, PackedGenome):
+        return len(_packed_matches(Pattern, Text))
+    Pattern = _as_str(Pattern)
     count = 0
     for i in range(len(Text)-len(Pattern)+1):
         if Text[i:i+len(Pattern)] == Pattern:
             count = count+1
     return count
 
-def Reverse(Pattern: str) -> str:
+def Reverse(Pattern: str | PackedGenome) -> str | PackedGenome:
     """
     Reverses the given DNA pattern.
 
-    This function returns the reverse of the input DNA sequence by reversing the order of its characters.
+    This function returns the reverse of the input DNA sequence by reversing the order of its characters
+    with a single slice, in linear time.
 
     Args:
-        Pattern (str): DNA sequence to be reversed.
+        Pattern (str | PackedGenome): DNA sequence to be reversed.
 
     Returns:
-        str: The reversed DNA sequence.
+        str | PackedGenome: The reversed DNA sequence, of the same type as the input.
 
     Example:
         >>> Reverse("ATCG")
         "GCTA"
     """
-    rev = ""
-    for char in Pattern:
-        rev = char + rev
-    return rev
+    return Pattern[::-1]
 
-def Complement(Pattern: str) -> str:
+def Complement(Pattern: str | PackedGenome) -> str | PackedGenome:
     """
     Returns the complementary DNA strand of the given pattern.
 
     This function substitutes each nucleotide in the input DNA sequence with its Watson-Crick complement:
-    A ↔ T, C ↔ G.
+    A ↔ T, C ↔ G. The substitution is done with a byte translation table in linear time; 
+    characters other than 'A', 'T', 'C' and 'G' are dropped.
 
     Args:
-        Pattern (str): DNA sequence consisting of characters 'A', 'T', 'C', and 'G'.
+        Pattern (str | PackedGenome): DNA sequence consisting of characters 'A', 'T', 'C', and 'G'.
 
     Returns:
-        str: The complementary DNA sequence.
+        str | PackedGenome: The complementary DNA sequence, of the same type as the input.
 
     Example:
         >>> Complement("ATCG")
         "TAGC"
     """
-    comp = ""
-    for char in Pattern:
-        if(char == 'T'):
-            comp = comp + 'A'
-        if(char == 'A'):
-            comp = comp + 'T'
-        if(char == 'C'):
-            comp = comp + 'G'
-        if(char == 'G'):
-            comp = comp + 'C'
-    return comp
+    if isinstance(Pattern, PackedGenome):
+        return PackedGenome.from_codes(3 - Pattern.codes())
+    return Pattern.encode("ascii", "ignore").translate(_COMPLEMENT, _NON_ACGT).decode("ascii")
 
-def ReverseComplement(Pattern: str) -> str:
+def ReverseComplement(Pattern: str | PackedGenome) -> str | PackedGenome:
     """
     Computes the reverse complement of a DNA sequence.
 
     This function first reverses the input DNA sequence, then replaces each nucleotide
-    with its Watson-Crick complement: A ↔ T, C ↔ G.
+    with its Watson-Crick complement: A ↔ T, C ↔ G. Both steps take linear time; use 
+    `ReverseComplementFile()` for genome files that should not be loaded into memory.
 
     Args:
-        Pattern (str): DNA sequence to be reverse-complemented.
+        Pattern (str | PackedGenome): DNA sequence to be reverse-complemented.
 
     Returns:
-        str: The reverse complement of the input sequence.
+        str | PackedGenome: The reverse complement of the input sequence, of the same type as the input.
 
     Example:
         >>> ReverseComplement("ATCG")
@@ -96,7 +107,41 @@ def ReverseComplement(Pattern: str) -> str:
     Pattern = Complement(Pattern) # complement each letter in a string
     return Pattern
 
-def PatternMatching(Pattern: str, Genome: str) -> list[int]:
+def ReverseComplementFile(filepath: str, output: TextIO, block_size: int = 1 << 22) -> int:
+    """
+    Writes the reverse complement of a genome file to an output stream in bounded memory.
+
+    The genome file (plain text or FASTA, cleaned like in `load_genome()`) is memory-mapped 
+    and read in blocks starting from its end, cutting lines where needed (a FASTA header cut 
+    by a block is still skipped). Every block is reverse-complemented and written immediately, 
+    so only one block is held in memory regardless of the genome size or its line layout.
+
+    Args:
+        filepath (str): Path to the genome file (plain text or FASTA).
+        output (TextIO): Writable text stream receiving the reverse complement as one continuous sequence.
+        block_size (int, optional): Maximum number of file bytes read per block. Default is 4 MiB.
+
+    Returns:
+        int: The number of bases written.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        ValueError: If the file is empty or contains invalid characters.
+
+    Example:
+        >>> with open("ecoli_rc.txt", "w") as out:
+        ...     ReverseComplementFile("data/ecoli.fasta", out)
+        4641652
+    """
+    written = 0
+    for block in _iter_sequence_blocks_reversed(filepath, block_size):
+        output.write(block[::-1].translate(_COMPLEMENT).decode("ascii"))
+        written += len(block)
+    if not written:
+        raise ValueError("The file is empty.")
+    return written
+
+def PatternMatching(Pattern: str, Genome: str | PackedGenome) -> list[int]:
     """
     Finds all starting positions where a given pattern appears exactly in a genome.
 
@@ -105,7 +150,7 @@ def PatternMatching(Pattern: str, Genome: str) -> list[int]:
 
     Args:
         Pattern (str): DNA pattern to search for.
-        Genome (str): DNA sequence in which to search for the pattern.
+        Genome (str | PackedGenome): DNA sequence in which to search for the pattern.
 
     Returns:
         list[int]: List of starting positions where the pattern occurs.
@@ -114,24 +159,370 @@ def PatternMatching(Pattern: str, Genome: str) -> list[int]:
         >>> PatternMatching("ATG", "ATGCATGATG")
         [0, 4, 7]
     """
+    if isinstance(Genome, PackedGenome):
+        return _packed_matches(Pattern, Genome).tolist()
+    Pattern = _as_str(Pattern)
     positions = []
     for i in range(len(Genome)-len(Pattern)+1):
         if Genome[i:i+len(Pattern)] == Pattern:
             positions.append(i)
     return positions
 
-def FasterSymbolArray(Genome: str, symbol: str) -> dict[int, int]:
+def _packed_matches(Pattern: str, Genome: PackedGenome) -> np.ndarray:
+    """Returns the start positions of the exact occurrences of a pattern in a packed genome, compared on its base codes."""
+    positions = [np.empty(0, dtype=np.int64)]
+    for start, mismatches in _mismatch_counts(Genome, [Pattern], 0):
+        positions.append(start + np.flatnonzero(mismatches[0] == 0))
+    return np.concatenate(positions)
+
+def _scan_codes(Genome: str | PackedGenome) -> np.ndarray:
+    """
+    Returns the symbol codes of a genome (A=0, C=1, G=2, T=3). Every other character, lowercase 
+    bases included, maps to 4 and never matches a base, in the pattern scans and the profile scores alike.
+    """
+    if isinstance(Genome, PackedGenome):
+        return Genome.codes()
+    return _SCAN_CODES[np.frombuffer(Genome.encode("ascii", "replace"), dtype=np.uint8)]
+
+def _aho_corasick(patterns: list[list[int]]) -> tuple[list[int], list[list[int]]]:
+    """
+    Builds an Aho-Corasick automaton over the symbol codes 0-4 (4 never matches).
+
+    Returns the complete transition table, with states pre-multiplied by 5 so that 
+    the next state is table[state + symbol], and the indices of the patterns ending 
+    in each state (following output links), indexed the same way.
+    """
+    children = [[-1] * 4]
+    output = [[]]
+    for index, pattern in enumerate(patterns):
+        state = 0
+        for symbol in pattern:
+            if children[state][symbol] < 0:
+                children[state][symbol] = len(children)
+                children.append([-1] * 4)
+                output.append([])
+            state = children[state][symbol]
+        output[state].append(index)
+    table = [0] * (5 * len(children))
+    fail = [0] * len(children)
+    queue = []
+    for symbol in range(4):
+        child = children[0][symbol]
+        if child > 0:
+            table[symbol] = 5 * child
+            queue.append(child)
+    # breadth-first, so the failure state of every child is complete before it is used
+    for state in queue:
+        for symbol in range(4):
+            child = children[state][symbol]
+            if child > 0:
+                fail[child] = table[5 * fail[state] + symbol] // 5
+                output[child] = output[child] + output[fail[child]]
+                table[5 * state + symbol] = 5 * child
+                queue.append(child)
+            else:
+                table[5 * state + symbol] = table[5 * fail[state] + symbol]
+    outputs = [[] for _ in table]
+    outputs[::5] = output
+    return table, outputs
+
+def PatternMatchingMany(Patterns: list[str], Genome: str | PackedGenome, reverse_complement: bool = False) -> dict[str, list[int]]:
+    """
+    Finds all starting positions of many patterns in a genome in a single pass.
+
+    Instead of calling `PatternMatching()` once per pattern, this function builds an 
+    Aho-Corasick automaton from all patterns and scans the genome once, reporting 
+    every occurrence of every pattern as the scan reaches its last symbol. The scan 
+    time depends on the genome length and the number of occurrences, but not on 
+    the number of patterns.
+
+    Args:
+        Patterns (list[str]): DNA patterns to search for (they may differ in length).
+        Genome (str | PackedGenome): DNA sequence in which to search for the patterns.
+        reverse_complement (bool, optional): Also report the positions where the reverse 
+            complement of each pattern occurs. Default is False.
+
+    Returns:
+        dict[str, list[int]]: For every pattern, the sorted list of starting positions where it 
+        (or, with `reverse_complement`, its reverse complement) occurs.
+
+    Example:
+        >>> PatternMatchingMany(["ATG", "CAT"], "ATGCATGATG")
+        {'ATG': [0, 4, 7], 'CAT': [3]}
+        >>> PatternMatchingMany(["ATG"], "ATGCATGATG", reverse_complement=True)
+        {'ATG': [0, 3, 4, 7]}
+    """
+    Patterns = [_as_str(Pattern) for Pattern in Patterns]
+    result = {Pattern: [] for Pattern in Patterns}
+    # each searched string remembers the patterns it reports positions for
+    searched = {}
+    for Pattern in result:
+        searched.setdefault(Pattern, []).append(Pattern)
+        if reverse_complement:
+            searched.setdefault(ReverseComplement(Pattern), []).append(Pattern)
+    words = [word for word in searched if word and not word.strip("ACGT")]
+    for word in searched:
+        if not word or word.strip("ACGT"):
+            # empty patterns and patterns with other characters are matched directly
+            positions = PatternMatching(word, Genome)
+            for Pattern in searched[word]:
+                result[Pattern].extend(positions)
+    table, output = _aho_corasick([_encode(word).tolist() for word in words])
+    lengths = [len(word) for word in words]
+    targets = [searched[word] for word in words]
+    state = 0
+    block_size = 1 << 20
+    for block in range(0, len(Genome), block_size):
+        # the genome is converted to a list of codes one block at a time to bound memory
+        for i, symbol in enumerate(_scan_codes(Genome[block:block + block_size]).tolist(), block):
+            state = table[state + symbol]
+            found = output[state]
+            if found:
+                for index in found:
+                    for Pattern in targets[index]:
+                        result[Pattern].append(i - lengths[index] + 1)
+    if reverse_complement:
+        for Pattern in result:
+            result[Pattern] = sorted(set(result[Pattern]))
+    return result
+
+def _suffix_array(codes: np.ndarray) -> np.ndarray:
+    """Builds the suffix array of a base code array terminated by a sentinel, by prefix doubling."""
+    n = len(codes)
+    # rank 0 is the sentinel, bases are ranked 1..4
+    rank = np.empty(n + 1, dtype=np.int64)
+    rank[:n] = codes
+    rank[:n] += 1
+    rank[n] = 0
+    h = 1
+    while True:
+        second = np.zeros(n + 1, dtype=np.int64)
+        second[:n + 1 - h] = rank[h:] + 1
+        key = rank * (n + 2) + second
+        del second
+        sa = np.argsort(key, kind="stable")
+        key = key[sa]
+        sorted_rank = np.empty(n + 1, dtype=np.int64)
+        sorted_rank[0] = 0
+        np.cumsum(key[1:] != key[:-1], out=sorted_rank[1:])
+        del key
+        rank[sa] = sorted_rank
+        if sorted_rank[-1] == n:
+            return sa.astype(np.int32 if n < 2**31 - 1 else np.int64)
+        h *= 2
+
+class GenomeIndex:
+    """
+    FM-index of a genome for fast repeated exact pattern queries.
+
+    The index is built once from the suffix array of the genome and stores its 
+    Burrows-Wheeler transform with occurrence checkpoints every 64 positions. A 
+    query is answered by backward search, one step per pattern symbol, so `count()` 
+    takes O(|Pattern|) time and `locate()` O(|Pattern| + occ) time, independently of 
+    the genome length. This replaces the full genome scan of `PatternCount()` and 
+    `PatternMatching()` when many queries are run against the same reference.
+
+    An index can be saved to a directory with `save()` and memory-mapped back with 
+    `GenomeIndex.load()`, so worker processes share it without rebuilding it.
+
+    Args:
+        Genome (str | PackedGenome): The DNA sequence to index (only 'A', 'C', 'G', 'T').
+
+    Raises:
+        ValueError: If the genome contains invalid characters.
+
+    Example:
+        >>> index = GenomeIndex("ATGCATGATG")
+        >>> index.count("ATG")
+        3
+        >>> index.locate("ATG")
+        [0, 4, 7]
+    """
+
+    def __init__(self, Genome: str | PackedGenome) -> None:
+        codes = _as_codes(Genome)
+        self._sa = _suffix_array(codes)
+        # the BWT holds the base preceding each sorted suffix, 4 marks the sentinel
+        self._bwt = np.full(len(self._sa), 4, dtype=np.uint8)
+        preceded = self._sa > 0
+        self._bwt[preceded] = codes[self._sa[preceded] - 1]
+        del preceded
+        # occ[b, j] is the number of base b in bwt[:64*j]
+        blocks = np.arange(0, len(self._bwt), 64)
+        self._occ = np.zeros((4, len(blocks) + 1), dtype=np.int64)
+        for base in range(4):
+            np.cumsum(np.add.reduceat((self._bwt == base).astype(np.int64), blocks), out=self._occ[base, 1:])
+        # first[b] is the row of the first suffix starting with base b
+        self._first = 1 + np.concatenate(([0], np.cumsum(self._occ[:, -1])[:-1]))
+
+    def __len__(self) -> int:
+        return len(self._sa) - 1
+
+    def _rank(self, base: int, i: int) -> int:
+        block = i >> 6
+        return int(self._occ[base, block]) + int(np.count_nonzero(self._bwt[block << 6:i] == base))
+
+    def _range(self, Pattern: str) -> tuple[int, int]:
+        try:
+            pattern = _encode(Pattern).tolist()
+        except ValueError:
+            return 0, 0
+        lo, hi = 0, len(self._sa)
+        for base in reversed(pattern):
+            lo = int(self._first[base]) + self._rank(base, lo)
+            hi = int(self._first[base]) + self._rank(base, hi)
+            if lo >= hi:
+                return 0, 0
+        return lo, hi
+
+    def count(self, Pattern: str) -> int:
+        """
+        Counts the exact occurrences of a pattern in the indexed genome.
+
+        Args:
+            Pattern (str): DNA pattern to find.
+
+        Returns:
+            int: Number of times the pattern occurs, like `PatternCount()`.
+        """
+        lo, hi = self._range(Pattern)
+        return hi - lo
+
+    def locate(self, Pattern: str) -> list[int]:
+        """
+        Finds all starting positions of a pattern in the indexed genome.
+
+        Args:
+            Pattern (str): DNA pattern to find.
+
+        Returns:
+            list[int]: Sorted starting positions of the pattern, like `PatternMatching()`.
+        """
+        lo, hi = self._range(Pattern)
+        return np.sort(self._sa[lo:hi]).tolist()
+
+    def save(self, path: str) -> None:
+        """
+        Saves the index as NumPy arrays in a directory.
+
+        Args:
+            path (str): Directory to write to (created if it does not exist).
+        """
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "suffix_array.npy"), self._sa)
+        np.save(os.path.join(path, "bwt.npy"), self._bwt)
+        np.save(os.path.join(path, "occ.npy"), self._occ)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "GenomeIndex":
+        """
+        Loads an index saved with `save()`.
+
+        Args:
+            path (str): Directory the index was saved to.
+            mmap (bool, optional): Memory-map the arrays instead of reading them. Default is True.
+
+        Returns:
+            GenomeIndex: The loaded index.
+
+        Example:
+            >>> GenomeIndex(genome).save("ecoli.idx")
+            >>> index = GenomeIndex.load("ecoli.idx")
+        """
+        mode = "r" if mmap else None
+        index = cls.__new__(cls)
+        index._sa = np.load(os.path.join(path, "suffix_array.npy"), mmap_mode=mode)
+        index._bwt = np.load(os.path.join(path, "bwt.npy"), mmap_mode=mode)
+        index._occ = np.load(os.path.join(path, "occ.npy"), mmap_mode=mode)
+        index._first = 1 + np.concatenate(([0], np.cumsum(index._occ[:, -1])[:-1]))
+        return index
+
+def _symbol_mask(Genome: str | PackedGenome, symbol: str) -> np.ndarray:
+    """Returns a boolean array marking the positions of a genome holding the given symbol."""
+    if len(symbol) != 1:
+        return np.zeros(len(Genome), dtype=bool)
+    if isinstance(Genome, PackedGenome):
+        return Genome.codes() == "ACGT".find(symbol)
+    return _char_array(Genome) == ord(symbol)
+
+def _window_counts(mask: np.ndarray, window: int, starts: np.ndarray, circular: bool) -> np.ndarray:
+    """Counts the marked positions in every window from prefix sums, wrapping around the end if circular."""
+    n = len(mask)
+    prefix = np.zeros(n + 1, dtype=np.int32)
+    np.cumsum(mask, dtype=np.int32, out=prefix[1:])
+    ends = starts + window
+    counts = prefix[np.minimum(ends, n)] - prefix[starts]
+    if circular:
+        # windows running past the end continue at the start of the genome
+        wrapped = ends > n
+        counts[wrapped] += prefix[ends[wrapped] - n]
+    return counts
+
+def WindowedComposition(Genome: str | PackedGenome, window: int | None = None, step: int = 1, circular: bool = True, symbols: str = "ACGT") -> dict[str, np.ndarray]:
+    """
+    Computes the windowed counts of all four nucleotides and the GC content in one pass.
+
+    The genome is encoded once, and for every window the number of 'A', 'C', 'G' and 
+    'T' bases is computed from a prefix sum of each symbol over that encoding, so every 
+    window costs two lookups regardless of its size. Windows of a circular genome that run past the end continue at its start 
+    without copying any part of the genome. This generalizes `FasterSymbolArray()` to 
+    all symbols, any window size and any step.
+
+    Args:
+        Genome (str | PackedGenome): The DNA sequence to analyze.
+        window (int, optional): Window length. Default is half of the genome length.
+        step (int, optional): Distance between the starts of consecutive windows. Default is 1.
+        circular (bool, optional): Treat the genome as circular, so there is a window starting 
+            at every position. Otherwise only windows fully inside the genome are used. Default is True.
+        symbols (str, optional): The symbols to count, so callers that need a single symbol do not 
+            pay for the others. Default is "ACGT".
+
+    Returns:
+        dict[str, np.ndarray]: int32 arrays of counts under each symbol key, and, when both 'C' and 
+        'G' are counted, the float32 GC content (fraction of 'C' and 'G' in the window) under 'GC'. 
+        Entry i belongs to the window starting at position i * step.
+
+    Raises:
+        ValueError: If the window or step is out of range.
+
+    Example:
+        >>> composition = WindowedComposition("AAAAGGGG")
+        >>> composition["A"]
+        array([4, 3, 2, 1, 0, 1, 2, 3], dtype=int32)
+        >>> composition["GC"]
+        array([0.  , 0.25, 0.5 , 0.75, 1.  , 0.75, 0.5 , 0.25], dtype=float32)
+        >>> WindowedComposition("AAAAGGGG", symbols="G")
+        {'G': array([0, 1, 2, 3, 4, 3, 2, 1], dtype=int32)}
+    """
+    n = len(Genome)
+    if window is None:
+        window = n // 2
+    if not 0 <= window <= n or step < 1:
+        raise ValueError("window must be between 0 and the genome length and step must be positive.")
+    starts = np.arange(0, n if circular else n - window + 1, step, dtype=np.int64)
+    # the genome is encoded once and the mask of every base is taken from the same code array
+    codes = _scan_codes(Genome)
+    composition = {}
+    for symbol in symbols:
+        mask = codes == "ACGT".index(symbol) if symbol in ("A", "C", "G", "T") else _symbol_mask(Genome, symbol)
+        composition[symbol] = _window_counts(mask, window, starts, circular)
+    if "C" in composition and "G" in composition:
+        gc = (composition["C"] + composition["G"]).astype(np.float32)
+        composition["GC"] = gc / window if window else gc
+    return composition
+
+def FasterSymbolArray(Genome: str | PackedGenome, symbol: str) -> dict[int, int]:
     """
     Efficiently computes the symbol frequency array over a sliding window of size n/2.
 
     This optimized version of SymbolArray avoids redundant computations by using a 
     sliding window approach. Instead of recomputing the number of occurrences of the 
-    symbol from scratch for each window, it updates the count by considering only the 
-    symbol that exits the window and the one that enters it. This reduces the time 
+    symbol from scratch for each window, it takes the difference of two prefix sums 
+    of the symbol, computed for all windows at once with NumPy. This reduces the time 
     complexity from O(n^2) to O(n), making it suitable for long genomes.
 
     Args:
-        Genome (str): The DNA sequence to analyze.
+        Genome (str | PackedGenome): The DNA sequence to analyze.
         symbol (str): The nucleotide symbol ('A', 'C', 'G', or 'T') to count.
 
     Returns:
@@ -144,27 +535,45 @@ def FasterSymbolArray(Genome: str, symbol: str) -> dict[int, int]:
 
     Notes:
         - The sliding window is of length n/2.
-        - The genome is virtually extended by its first n/2 characters to handle wrapping.
+        - Windows running past the end wrap around to the start of the genome.
+        - `WindowedComposition()` returns the counts of all four symbols as compact arrays.
     """
-    array = {}
     n = len(Genome)
-    ExtendedGenome = Genome + Genome[0:n//2]
+    counts = _window_counts(_symbol_mask(Genome, symbol), n // 2, np.arange(n, dtype=np.int64), True)
+    return dict(enumerate(counts.tolist()))
+
+def _skew_steps(Genome: str | PackedGenome) -> np.ndarray:
+    """Maps every base of a genome to its skew increment: +1 for 'G', -1 for 'C' and 0 otherwise."""
+    if isinstance(Genome, PackedGenome):
+        codes = Genome.codes()
+        return (codes == 2).view(np.int8) - (codes == 1).view(np.int8)
+    chars = _char_array(Genome)
+    return (chars == ord("G")).view(np.int8) - (chars == ord("C")).view(np.int8)
+
+def CompactSkewArray(Genome: str | PackedGenome) -> np.ndarray:
+    """
+    Computes the skew array of a DNA genome as a compact NumPy array.
+
+    This is the vectorized form of `SkewArray()`: the bases are mapped to +1 ('G'), 
+    -1 ('C') or 0 and accumulated with `np.cumsum` into an int32 array, which takes 
+    4 bytes per position instead of a Python list entry per position.
 
-    # look at the first half of Genome to compute first array value
-    array[0] = PatternCount(Genome[0:n//2], symbol)
+    Args:
+        Genome (str | PackedGenome): The DNA sequence to analyze.
 
-    for i in range(1, n):
-        # start by setting the current array value equal to the previous array value
-        array[i] = array[i-1]
+    Returns:
+        np.ndarray: An int32 array of skew values, one for each position from 0 to len(Genome).
 
-        # the current array value can differ from the previous array value by at most 1
-        if ExtendedGenome[i-1] == symbol:
-            array[i] = array[i]-1
-        if ExtendedGenome[i+(n//2)-1] == symbol:
-            array[i] = array[i]+1
-    return array
+    Example:
+        >>> CompactSkewArray("CAGTGC")
+        array([ 0, -1, -1,  0,  0,  1,  0], dtype=int32)
+    """
+    steps = _skew_steps(Genome)
+    skew = np.zeros(len(steps) + 1, dtype=np.int32)
+    np.cumsum(steps, dtype=np.int32, out=skew[1:])
+    return skew
 
-def SkewArray(Genome: str) -> list[int]:
+def SkewArray(Genome: str | PackedGenome) -> list[int]:
     """
     Computes the skew array of a DNA genome.
 
@@ -176,36 +585,32 @@ def SkewArray(Genome: str) -> list[int]:
     This array is particularly useful for identifying the origin of replication, 
     as the minimum point typically corresponds to the location of the ori.
 
+    The values are computed with `CompactSkewArray()` and converted to a list; use 
+    that function directly to keep the compact array for long genomes.
+
     Args:
-        Genome (str): The DNA sequence to analyze.
+        Genome (str | PackedGenome): The DNA sequence to analyze.
 
     Returns:
         list[int]: A list of skew values, one for each position from 0 to len(Genome).
 
     Example:
         >>> SkewArray("CAGTGC")
-        [0, -1, -1, 0, 1, 1, 0]
-    """
-    skew = [0]
-    for i in range(len(Genome)):
-        if Genome[i] == "C":
-            skew.append(skew[-1] - 1)
-        elif Genome[i] == "G":
-            skew.append(skew[-1] + 1)
-        else:
-            skew.append(skew[-1])
-    return skew
+        [0, -1, -1, 0, 0, 1, 0]
+    """
+    return CompactSkewArray(Genome).tolist()
 
-def MinimumSkew(Genome: str) -> list[int]:
+def MinimumSkew(Genome: str | PackedGenome) -> list[int]:
     """
     Identifies all positions in the genome where the skew array reaches its minimum value.
 
     This function computes the skew array of the genome and returns all indices where 
     the skew is minimal. These positions are biologically significant, as the origin of 
-    replication (ori) often occurs near the minimum skew point.
+    replication (ori) often occurs near the minimum skew point. The skew is kept as a 
+    compact array and its minima are found with a single vectorized comparison.
 
     Args:
-        Genome (str): The DNA sequence to analyze.
+        Genome (str | PackedGenome): The DNA sequence to analyze.
 
     Returns:
         list[int]: A list of genome positions where the skew is minimal.
@@ -214,9 +619,49 @@ def MinimumSkew(Genome: str) -> list[int]:
         >>> MinimumSkew("TAAAGACTGCCGAGAGGCCAACACGAGTGCTAGAACGAGGGGCGTAAACGCGGGTCCGAT")
         [11, 24]
     """
-    positions = []
-    skew = SkewArray(Genome)
-    return MinPositions(skew)
+    skew = CompactSkewArray(Genome)
+    return np.flatnonzero(skew == skew.min()).tolist()
+
+def StreamingMinimumSkew(Chunks: str | PackedGenome | Iterable[str | PackedGenome], chunk_size: int = 1 << 20) -> list[int]:
+    """
+    Identifies the positions of minimum skew without materializing the skew array.
+
+    The genome is processed chunk by chunk (for example from `iter_genome_chunks()`), 
+    carrying the skew value at the end of each chunk into the next one and tracking 
+    the running minimum together with its positions. Only one chunk of skew values is 
+    held in memory at a time. The result is identical to `MinimumSkew()`.
+
+    Args:
+        Chunks (str | PackedGenome | Iterable[str | PackedGenome]): The DNA sequence, either 
+            whole or as consecutive chunks.
+        chunk_size (int, optional): Chunk length used when a whole sequence is given. Default is 1 Mbp.
+
+    Returns:
+        list[int]: A list of genome positions where the skew is minimal.
+
+    Example:
+        >>> StreamingMinimumSkew(iter_genome_chunks("data/ecoli.fasta"))
+        [3923620, 3923621, 3923622, 3923623]
+    """
+    if isinstance(Chunks, (str, PackedGenome)):
+        sequence = Chunks
+        Chunks = (sequence[i:i + chunk_size] for i in range(0, len(sequence), chunk_size))
+    minimum = 0
+    positions = [0]
+    offset = 0
+    value = 0
+    for chunk in Chunks:
+        skew = value + np.cumsum(_skew_steps(chunk), dtype=np.int64)
+        if len(skew):
+            low = int(skew.min())
+            if low < minimum:
+                minimum = low
+                positions = []
+            if low == minimum:
+                positions.extend((np.flatnonzero(skew == low) + offset + 1).tolist())
+            value = int(skew[-1])
+            offset += len(skew)
+    return positions
 
 def HammingDistance(p: str, q: str) -> int:
     """
@@ -242,13 +687,196 @@ def HammingDistance(p: str, q: str) -> int:
     """
     if len(p) != len(q):
         raise ValueError("Strings must be of equal length to compute Hamming distance.")
-    count = 0
-    for i in range(len(p)):
-        if(p[i] != q[i]):
-            count+=1
-    return count
+    return sum(map(operator.ne, p, q))
 
-def ApproximatePatternMatching(Text: str, Pattern: str, d: int) -> list[int]:
+def _char_array(Text: str) -> np.ndarray:
+    """Returns the characters of a string as an array of integer character codes."""
+    if Text.isascii():
+        return np.frombuffer(Text.encode("ascii"), dtype=np.uint8)
+    return np.frombuffer(Text.encode("utf-32-le"), dtype=np.uint32)
+
+def HammingDistances(Pattern: str, Text: str | PackedGenome) -> np.ndarray:
+    """
+    Computes the Hamming distance between a pattern and every window of a text.
+
+    This is the batched form of `HammingDistance()`: instead of slicing and comparing 
+    each window separately, the text is compared with one pattern symbol at a time over 
+    all windows at once, so the whole text is processed in len(Pattern) vectorized passes.
+
+    Args:
+        Pattern (str): The pattern to compare.
+        Text (str | PackedGenome): The text whose windows are compared with the pattern.
+
+    Returns:
+        np.ndarray: An int32 array with the Hamming distance of each window, indexed by 
+        window start position (empty if the text is shorter than the pattern).
+
+    Example:
+        >>> HammingDistances("GAT", "GATTACA").tolist()
+        [0, 2, 3, 2, 3]
+    """
+    distances = [np.empty(0, dtype=np.int32)]
+    for _, mismatches in _mismatch_counts(Text, [Pattern]):
+        distances.append(mismatches[0].astype(np.int32))
+    return np.concatenate(distances)
+
+def _kmer_words(kmers: list[str], k: int) -> np.ndarray | None:
+    """
+    Packs equal-length k-mers into 64-bit words of 32 bases each, or returns None if 
+    any k-mer contains a symbol other than 'A', 'C', 'G' or 'T'.
+    """
+    chars = np.frombuffer("".join(kmers).encode("ascii", "replace"), dtype=np.uint8)
+    codes = _SCAN_CODES[chars].reshape(len(kmers), k)
+    if codes.size and codes.max() > 3:
+        return None
+    words = np.zeros((len(kmers), -(-k // 32)), dtype=np.uint64)
+    for j in range(k):
+        word = words[:, j // 32]
+        word <<= np.uint64(2)
+        word |= codes[:, j]
+    return words
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Counts the set bits of every 64-bit word."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    return _BYTE_POPCOUNT[words.view(np.uint8)].reshape(words.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+_BYTE_POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+_LOW_BITS = np.uint64(0x5555555555555555)
+
+def HammingDistanceMatrix(A: list[str], B: list[str] | None = None, block_size: int = 1 << 22) -> np.ndarray:
+    """
+    Computes the Hamming distances between every pair of k-mers from two collections.
+
+    DNA k-mers are packed two bits per base into 64-bit words. For a pair of words, 
+    XOR leaves a non-zero 2-bit group exactly where the bases differ, so folding each 
+    group onto its low bit and counting the set bits gives the Hamming distance of up 
+    to 32 bases in a few integer operations. The pairs are evaluated with NumPy 
+    broadcasting, a block of rows of the matrix at a time. Collections containing 
+    other symbols fall back to comparing the characters column by column.
+
+    Args:
+        A (list[str]): The first collection of k-mers, one per matrix row.
+        B (list[str] | None, optional): The second collection of k-mers, one per matrix 
+            column. Defaults to `A` (all-vs-all distances).
+        block_size (int, optional): Approximate number of matrix entries computed per 
+            vectorized block. Default is 4,194,304.
+
+    Returns:
+        np.ndarray: A len(A) x len(B) matrix of Hamming distances (uint8 for k-mers of 
+        up to 255 symbols, int32 otherwise).
+
+    Raises:
+        ValueError: If the k-mers are not all of the same length.
+
+    Example:
+        >>> HammingDistanceMatrix(["ACGT", "ACGA"], ["ACGT", "TTTT", "ACCA"]).tolist()
+        [[0, 3, 2], [1, 4, 1]]
+    """
+    A = [_as_str(kmer) for kmer in A]
+    B = A if B is None else [_as_str(kmer) for kmer in B]
+    lengths = {len(kmer) for kmer in A + B}
+    if len(lengths) > 1:
+        raise ValueError("All k-mers must be of equal length to compute Hamming distances.")
+    k = lengths.pop() if lengths else 0
+    dtype = np.uint8 if k < 256 else np.int32
+    matrix = np.zeros((len(A), len(B)), dtype=dtype)
+    if not matrix.size or not k:
+        return matrix
+    rows = max(1, block_size // len(B))
+    words_a, words_b = _kmer_words(A, k), _kmer_words(B, k)
+    if words_a is not None and words_b is not None:
+        for start in range(0, len(A), rows):
+            block = matrix[start:start + rows]
+            for column in range(words_a.shape[1]):
+                differences = words_a[start:start + rows, column, None] ^ words_b[None, :, column]
+                block += _popcount((differences | (differences >> np.uint64(1))) & _LOW_BITS).astype(dtype)
+        return matrix
+    chars_a = np.array([_char_array(kmer).astype(np.uint32) for kmer in A])
+    chars_b = np.array([_char_array(kmer).astype(np.uint32) for kmer in B])
+    for start in range(0, len(A), rows):
+        block = matrix[start:start + rows]
+        for j in range(k):
+            block += chars_a[start:start + rows, j, None] != chars_b[None, :, j]
+    return matrix
+
+def _mismatch_counts(Text: str | PackedGenome, Patterns: list[str], d: int | None = None, block_size: int = 1 << 16) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Compares several equal-length patterns against all windows of a text, block by block.
+
+    For each block of windows and each pattern offset, the contiguous slice of text 
+    symbols at that offset is compared with the symbol of every pattern at once and 
+    added to per-window mismatch counters, so all windows of the block are evaluated 
+    in k vectorized passes. If d is given, a block is abandoned early as soon as every 
+    window in it exceeds d mismatches for every pattern, leaving its counts partial.
+
+    Yields the first window of each block with its mismatch counts (one row per pattern).
+    """
+    Patterns = [_as_str(Pattern) for Pattern in Patterns]
+    k = len(Patterns[0])
+    if isinstance(Text, PackedGenome):
+        # the packed genome is unpacked one block of windows at a time
+        text = Text
+        patterns = np.array([_SCAN_CODES[np.frombuffer(Pattern.encode("ascii", "replace"), dtype=np.uint8)] for Pattern in Patterns])
+    else:
+        text = _char_array(Text)
+        patterns = [_char_array(Pattern) for Pattern in Patterns]
+        if any(pattern.dtype != text.dtype for pattern in patterns):
+            text = text.astype(np.uint32)
+        patterns = np.array(patterns, dtype=text.dtype).reshape(len(Patterns), k)
+    windows = len(text) - k + 1
+    counter = np.uint8 if k < 256 else np.int32
+    for start in range(0, max(windows, 0), block_size):
+        stop = min(start + block_size, windows)
+        mismatches = np.zeros((len(Patterns), stop - start), dtype=counter)
+        block = text[start:stop + k - 1]
+        if isinstance(block, PackedGenome):
+            block = block.codes()
+        for j in range(k):
+            symbols = block[j:j + stop - start]
+            for row in range(len(Patterns)):
+                mismatches[row] += symbols != patterns[row, j]
+            if d is not None and j >= d and mismatches.min() > d:
+                break
+        yield start, mismatches
+
+def _mismatch_blocks(Text: str | PackedGenome, Patterns: list[str], d: int, block_size: int = 1 << 16) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Yields the first window of each block of a text with a boolean matrix (one row per 
+    pattern) telling which windows of the block are within Hamming distance d.
+    """
+    if d < 0:
+        return
+    k = len(_as_str(Patterns[0]))
+    if d >= k:
+        # every window matches, nothing to compare
+        for start in range(0, max(len(Text) - k + 1, 0), block_size):
+            yield start, np.ones((len(Patterns), min(block_size, len(Text) - k + 1 - start)), dtype=bool)
+        return
+    for start, mismatches in _mismatch_counts(Text, Patterns, d, block_size):
+        yield start, mismatches <= d
+
+def _approximate_hits(Text: str | PackedGenome, Patterns: list[str], d: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the windows of a text within Hamming distance d of any of several equal-length patterns.
+
+    Returns the sorted positions of the matching windows and a boolean matrix with one 
+    row per pattern telling which patterns match each of them.
+    """
+    found = [np.empty(0, dtype=np.int64)]
+    hits = [np.empty((len(Patterns), 0), dtype=bool)]
+    for start, block in _mismatch_blocks(Text, Patterns, d):
+        matched = block.any(axis=0)
+        found.append(np.flatnonzero(matched) + start)
+        hits.append(block[:, matched])
+    return np.concatenate(found), np.concatenate(hits, axis=1)
+
+def _approximate_positions(Text: str | PackedGenome, Pattern: str, d: int) -> np.ndarray:
+    """Finds the windows of a text within Hamming distance d of a pattern, vectorized over all windows."""
+    return _approximate_hits(Text, [Pattern], d)[0]
+
+def ApproximatePatternMatching(Text: str | PackedGenome, Pattern: str, d: int) -> list[int]:
     """
     Finds all starting positions where a pattern appears in a text with at most d mismatches.
 
@@ -256,8 +884,12 @@ def ApproximatePatternMatching(Text: str, Pattern: str, d: int) -> list[int]:
     and computing the Hamming distance at each position. All positions where the distance 
     is less than or equal to `d` are returned.
 
+    The distances of all windows are computed at once with NumPy: the pattern is compared 
+    offset by offset against whole blocks of windows, and a block is abandoned as soon as 
+    all of its windows have more than `d` mismatches.
+
     Args:
-        Text (str): The DNA sequence in which to search for the pattern.
+        Text (str | PackedGenome): The DNA sequence in which to search for the pattern.
         Pattern (str): The DNA pattern to search for.
         d (int): Maximum number of allowed mismatches (Hamming distance threshold).
 
@@ -266,25 +898,23 @@ def ApproximatePatternMatching(Text: str, Pattern: str, d: int) -> list[int]:
 
     Example:
         >>> ApproximatePatternMatching("CGCCCGAATCCAGAACGCATTCCCATATTTCGGGACCACTGGCCTCCACGGTACGGACGTCAATCAAAT", "ATTCTGGA", 3)
-        [6, 7, 26 27]
+        [6, 7, 26, 27]
     """
-    positions = []
-    for i in range(len(Text)-len(Pattern)+1):
-        distance = HammingDistance(Text[i:i+len(Pattern)], Pattern)
-        if distance <= d:
-            positions.append(i)
-    return positions
+    return _approximate_positions(Text, Pattern, d).tolist()
 
-def ApproximatePatternCount(Pattern: str, Text: str, d: int) -> int:
+def ApproximatePatternCount(Pattern: str, Text: str | PackedGenome, d: int) -> int:
     """
     Counts the number of times a pattern appears in a text with at most d mismatches.
 
     This function scans the text for substrings that approximately match the pattern,
     allowing for up to `d` mismatches based on Hamming distance, and returns how many such matches exist.
+    It uses the same vectorized engine as `ApproximatePatternMatching()` but only counts the 
+    matching windows of each block without collecting their positions, and it skips the 
+    comparison entirely when `d` is at least the pattern length.
 
     Args:
         Pattern (str): The DNA pattern to search for.
-        Text (str): The DNA sequence in which to search.
+        Text (str | PackedGenome): The DNA sequence in which to search.
         d (int): Maximum number of allowed mismatches.
 
     Returns:
@@ -294,9 +924,166 @@ def ApproximatePatternCount(Pattern: str, Text: str, d: int) -> int:
         >>> ApproximatePatternCount("GAGG", "TTTAGAGCCTTCAGAGG", 2)
         4
     """
-    count = 0
-    for i in range(len(Text)-len(Pattern)+1):
-        distance = HammingDistance(Text[i:i+len(Pattern)], Pattern)
-        if distance <= d:
-            count = count+1
-    return count
+    return sum(int(np.count_nonzero(block)) for _, block in _mismatch_blocks(Text, [Pattern], d))
+
+def _strand_hits(Text: str | PackedGenome, Pattern: str, d: int) -> list[tuple[int, str]]:
+    """Searches both strands in one pass and tags the hits with '+' or '-' (palindromes only once)."""
+    Pattern = _as_str(Pattern)
+    if Pattern.strip("ACGT"):
+        raise ValueError("Pattern must consist of 'A', 'C', 'G' and 'T' only.")
+    reverse = ReverseComplement(Pattern)
+    if reverse == Pattern:
+        return [(position, "+") for position in _approximate_positions(Text, Pattern, d).tolist()]
+    positions, hits = _approximate_hits(Text, [Pattern, reverse], d)
+    tagged = [(position, "+") for position in positions[hits[0]].tolist()]
+    tagged += [(position, "-") for position in positions[hits[1]].tolist()]
+    tagged.sort()
+    return tagged
+
+def PatternMatchingBothStrands(Pattern: str, Genome: str | PackedGenome) -> list[tuple[int, str]]:
+    """
+    Finds all positions where a pattern occurs on either strand of a genome, in a single pass.
+
+    An occurrence on the reverse strand is a position where the reverse complement of 
+    the pattern occurs in the genome. Both orientations are compared against every 
+    window during the same scan, instead of calling `PatternMatching()` twice. A 
+    palindromic pattern (equal to its own reverse complement) is reported once per 
+    position, on the '+' strand.
+
+    Args:
+        Pattern (str): DNA pattern to search for ('A', 'C', 'G' and 'T' only).
+        Genome (str | PackedGenome): DNA sequence in which to search for the pattern.
+
+    Returns:
+        list[tuple[int, str]]: (position, strand) pairs sorted by position, where strand is '+' 
+        for the pattern itself and '-' for its reverse complement.
+
+    Raises:
+        ValueError: If the pattern contains characters other than 'A', 'C', 'G' and 'T'.
+
+    Example:
+        >>> PatternMatchingBothStrands("ATG", "ATGCATGATG")
+        [(0, '+'), (3, '-'), (4, '+'), (7, '+')]
+    """
+    return _strand_hits(Genome, Pattern, 0)
+
+def ApproximatePatternMatchingBothStrands(Text: str | PackedGenome, Pattern: str, d: int) -> list[tuple[int, str]]:
+    """
+    Finds all positions where a pattern occurs with at most d mismatches on either strand, in a single pass.
+
+    The pattern and its reverse complement are compared against every window of the text 
+    during the same vectorized scan used by `ApproximatePatternMatching()`, so the text is 
+    read once for both strands. A palindromic pattern is reported once per position, on 
+    the '+' strand.
+
+    Args:
+        Text (str | PackedGenome): The DNA sequence in which to search for the pattern.
+        Pattern (str): The DNA pattern to search for ('A', 'C', 'G' and 'T' only).
+        d (int): Maximum number of allowed mismatches.
+
+    Returns:
+        list[tuple[int, str]]: (position, strand) pairs sorted by position, where strand is '+' 
+        for matches of the pattern and '-' for matches of its reverse complement. A position 
+        matching both orientations appears twice.
+
+    Raises:
+        ValueError: If the pattern contains characters other than 'A', 'C', 'G' and 'T'.
+
+    Example:
+        >>> ApproximatePatternMatchingBothStrands("TTTAGAGCCTTCAGAGG", "GAGG", 1)
+        [(4, '+'), (7, '-'), (8, '-'), (13, '+')]
+    """
+    return _strand_hits(Text, Pattern, d)
+
+def _neighborhood_masks(k: int, d: int) -> np.ndarray:
+    """Returns the XOR masks turning a 2-bit encoded k-mer into each k-mer within Hamming distance d."""
+    masks = [0]
+    for mismatches in range(1, min(d, k) + 1):
+        for positions in itertools.combinations(range(k), mismatches):
+            # XOR with 1, 2 or 3 changes a base into each of the other three
+            for changes in itertools.product((1, 2, 3), repeat=mismatches):
+                masks.append(sum(change << 2 * (k - 1 - position) for position, change in zip(positions, changes)))
+    return np.array(masks, dtype=np.uint64)
+
+# reverse complement of the four 2-bit bases packed in each byte value
+_BYTE_REVERSE_COMPLEMENT = np.array([sum(((3 - (byte >> 2 * i & 3)) << 2 * (3 - i)) for i in range(4)) for byte in range(256)], dtype=np.uint8)
+
+def _reverse_complement_codes(kmers: np.ndarray, k: int) -> np.ndarray:
+    """Returns the integer codes of the reverse complements of 2-bit encoded k-mers."""
+    # reversing the bytes of the 64-bit word and each byte's bases reverse-complements 32 
+    # bases; the complemented padding above the k-mer lands in the low bits and is shifted out
+    words = np.ascontiguousarray(kmers, dtype="<u8").view(np.uint8).reshape(-1, 8)
+    reverse = np.ascontiguousarray(_BYTE_REVERSE_COMPLEMENT[words[:, ::-1]]).view("<u8").ravel()
+    return (reverse >> np.uint64(64 - 2 * k)).astype(np.uint64)
+
+def FrequentWordsWithMismatches(Text: str | PackedGenome, k: int, d: int, reverse_complement: bool = True) -> list[str]:
+    """
+    Finds the most frequent k-mers with up to d mismatches (and, optionally, their reverse complements).
+
+    A k-mer Pattern appears approximately at every window within Hamming distance `d` of it, 
+    so its count is `ApproximatePatternCount(Pattern, Text, d)`, plus the count of its reverse 
+    complement when `reverse_complement` is set. Instead of trying all 4^k candidate patterns, 
+    this function counts the distinct k-mers that actually occur with `CountKmers()` and adds the 
+    count of each one to every k-mer of its d-neighborhood. The neighborhoods are generated 
+    with integer XOR masks on the 2-bit encoded k-mers and accumulated in a count array (a 
+    dense table of all 4^k k-mers for k up to 12). For longer k-mers, each batch of neighborhoods 
+    is reduced to a sorted run of codes and counts and the runs are merged once at the end; with 
+    `reverse_complement`, every neighbor is counted under the canonical form of its pair (the 
+    smaller of its code and that of its reverse complement), so no lookup of the reverse 
+    complement counts is needed.
+
+    Args:
+        Text (str | PackedGenome): The DNA sequence to search (only 'A', 'C', 'G', 'T').
+        k (int): Length of the k-mers, between 1 and 32.
+        d (int): Maximum number of mismatches.
+        reverse_complement (bool, optional): Add the approximate count of each pattern's reverse 
+            complement to its own count. Default is True.
+
+    Returns:
+        list[str]: The k-mers with the highest approximate count, in lexicographic order.
+
+    Raises:
+        ValueError: If `k` or `d` is out of range or the sequence contains invalid characters.
+
+    Example:
+        >>> FrequentWordsWithMismatches("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4, 1, reverse_complement=False)
+        ['ATGC', 'ATGT', 'GATG']
+        >>> FrequentWordsWithMismatches("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4, 1)
+        ['ACAT', 'ATGT']
+    """
+    if d < 0:
+        raise ValueError("d must not be negative.")
+    counts = CountKmers(Text, k)
+    if not len(counts):
+        return []
+    masks = _neighborhood_masks(k, d)
+    batch = max(1, (1 << 22) // len(masks))
+    if k <= 12:
+        approximate = np.zeros(4 ** k, dtype=np.int64)
+        for start in range(0, len(counts), batch):
+            neighbors = counts.codes[start:start + batch, None] ^ masks[None, :]
+            np.add.at(approximate, neighbors.ravel().astype(np.intp), np.repeat(counts.counts[start:start + batch], len(masks)))
+        candidates = np.flatnonzero(approximate).astype(np.uint64)
+        totals = approximate[candidates.astype(np.intp)]
+        if reverse_complement:
+            candidates = np.union1d(candidates, _reverse_complement_codes(candidates, k))
+            indices = candidates.astype(np.intp)
+            totals = approximate[indices] + approximate[_reverse_complement_codes(candidates, k).astype(np.intp)]
+    else:
+        runs = []
+        for start in range(0, len(counts), batch):
+            neighbors = (counts.codes[start:start + batch, None] ^ masks[None, :]).ravel()
+            weights = np.repeat(counts.counts[start:start + batch], len(masks))
+            if reverse_complement:
+                # a pattern and its reverse complement share one total, so every neighbor is counted 
+                # under the smaller code of the pair (a palindrome gets the counts of both strands)
+                reverse = _reverse_complement_codes(neighbors, k)
+                weights = np.where(neighbors == reverse, 2 * weights, weights)
+                neighbors = np.minimum(neighbors, reverse)
+            runs.append(_merge_kmer_counts([(neighbors, weights)]))
+        # the runs are already sorted, so the stable sort of the final merge only interleaves them
+        candidates, totals = _merge_kmer_counts(runs)
+        if reverse_complement:
+            best = candidates[totals == totals.max()]
+            return _decode_kmers(np.union1d(best, _reverse_complement_codes(best, k)), k)
+    return _decode_kmers(candidates[totals == totals.max()], k)
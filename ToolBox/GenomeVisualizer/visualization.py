@@ -4,10 +4,55 @@ import matplotlib.pyplot as plt
 import logomaker
 from GenomeVisualizer.motifs import Profile
 
-def plot_symbol_array_impl(symbol_array: dict[int, int], symbol: str, genome_label: str = "genome") -> plt.Figure:
+def decimate_minmax(x: np.ndarray, y: np.ndarray, max_points: int = 4000) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces a long line series to at most `max_points` points while keeping its extrema.
+
+    The series is split into `max_points // 2 - 1` equal buckets (about two per pixel 
+    of a typical figure, leaving room for the endpoints) and only the minimum and 
+    maximum point of every bucket are kept, in their original order, together with 
+    the first and last point. The plotted line therefore has the same envelope as 
+    the full series, and extrema such as the skew minima stay visible. Series that 
+    are already short enough are returned unchanged.
+
+    Args:
+        x (np.ndarray): x coordinates of the series.
+        y (np.ndarray): y values of the series, same length as `x`.
+        max_points (int, optional): Maximum number of points to keep. Default is 4000.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The x coordinates and y values of the kept points.
+
+    Example:
+        >>> skew = CompactSkewArray(genome)
+        >>> x, y = decimate_minmax(np.arange(len(skew)), skew)
+        >>> len(x) <= 4000
+        True
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    buckets = max(max_points // 2 - 1, 1)
+    size = -(-n // buckets)
+    # pad with the last value so the series splits into equal buckets; argmin and argmax
+    # return the first extremum, so a padded copy is never chosen over the real point
+    padded = np.concatenate((y, np.full(buckets * size - n, y[-1], dtype=y.dtype))).reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    keep = np.concatenate(([0, n - 1], offsets + padded.argmin(axis=1), offsets + padded.argmax(axis=1)))
+    keep = np.unique(np.minimum(keep, n - 1))
+    return x[keep], y[keep]
+
+def plot_symbol_array_impl(symbol_array: dict[int, int] | np.ndarray, symbol: str, genome_label: str = "genome", max_points: int = 4000) -> plt.Figure:
     """See plot_symbol_array"""
-    positions = list(symbol_array.keys())
-    counts = list(symbol_array.values())
+    if isinstance(symbol_array, dict):
+        positions = list(symbol_array.keys())
+        counts = list(symbol_array.values())
+    else:
+        positions = np.arange(len(symbol_array))
+        counts = symbol_array
+    positions, counts = decimate_minmax(positions, counts, max_points)
 
     fig = plt.figure(figsize=(10, 5))
     plt.plot(positions, counts, color="blue")
@@ -18,18 +63,21 @@ def plot_symbol_array_impl(symbol_array: dict[int, int], symbol: str, genome_lab
     plt.tight_layout()
     return fig
 
-def plot_symbol_array(symbol_array: dict[int, int], symbol: str, genome_label: str = "genome") -> None:
+def plot_symbol_array(symbol_array: dict[int, int] | np.ndarray, symbol: str, genome_label: str = "genome", max_points: int = 4000) -> None:
     """
     Plots the symbol frequency array across the genome.
 
     This function visualizes the number of occurrences of a specified nucleotide 
     in a sliding window (typically of size genome_length/2), showing variation 
-    in composition across the genome.
+    in composition across the genome. Arrays longer than `max_points` are reduced 
+    with `decimate_minmax()` before plotting.
 
     Args:
-        symbol_array (dict[int, int]): Dictionary mapping genome positions to the count of a symbol in the sliding window.
+        symbol_array (dict[int, int] | np.ndarray): Dictionary mapping genome positions to the count of a symbol 
+            in the sliding window, or an array of counts such as one returned by `WindowedComposition()`.
         symbol (str): The nucleotide symbol ('A', 'C', 'G', or 'T') used for counting.
         genome_label (str, optional): Label for the genome, used in the figure title. Default is "genome".
+        max_points (int, optional): Maximum number of points drawn. Default is 4000.
 
     Returns:
         None: The function displays the plot using matplotlib.
@@ -38,17 +86,21 @@ def plot_symbol_array(symbol_array: dict[int, int], symbol: str, genome_label: s
         >>> arr = FasterSymbolArray(genome, 'C')
         >>> plot_symbol_array(arr, 'C', genome_label="E. coli")
     """
-    plot_symbol_array_impl(symbol_array, symbol, genome_label)
+    plot_symbol_array_impl(symbol_array, symbol, genome_label, max_points)
     plt.show()
 
-def plot_skew_array_with_ori_impl(skew: list[int], ori_positions: list[int], genome_label: str = "genome") -> plt.Figure:
+def plot_skew_array_with_ori_impl(skew: list[int] | np.ndarray, ori_positions: list[int], genome_label: str = "genome", max_points: int = 4000) -> plt.Figure:
     """
     Plots the skew array and highlights the estimated origin(s) of replication.
 
+    Skew arrays longer than `max_points` are reduced with `decimate_minmax()` before 
+    plotting; the minima are kept, and the ori markers use the full array.
+
     Args:
-        skew (list[int]): Skew values computed across the genome.
+        skew (list[int] | np.ndarray): Skew values computed across the genome.
         ori_positions (list[int]): Positions where the skew reaches its minimum (possible ori sites).
         genome_label (str, optional): Name of the genome to show in the title. Default is "genome".
+        max_points (int, optional): Maximum number of points drawn. Default is 4000.
 
     Returns:
         None: The function displays the plot using matplotlib.
@@ -58,8 +110,9 @@ def plot_skew_array_with_ori_impl(skew: list[int], ori_positions: list[int], gen
         >>> ori_pos = MinimumSkew(genome)
         >>> plot_skew_array_with_ori(skew, ori_pos, genome_label="E. coli")
     """
+    positions, values = decimate_minmax(np.arange(len(skew)), skew, max_points)
     fig = plt.figure(figsize=(10, 5))
-    plt.plot(range(len(skew)), skew, label="Skew", color="darkgreen")
+    plt.plot(positions, values, label="Skew", color="darkgreen")
     plt.scatter(ori_positions, [skew[pos] for pos in ori_positions], color="red", label="Minimum skew (ori?)")
     plt.xlabel("Genome position")
     plt.ylabel("Skew (G - C)")
@@ -69,14 +122,18 @@ def plot_skew_array_with_ori_impl(skew: list[int], ori_positions: list[int], gen
     plt.tight_layout()
     return fig
 
-def plot_skew_array_with_ori(skew: list[int], ori_positions: list[int], genome_label: str = "genome") -> None:
+def plot_skew_array_with_ori(skew: list[int] | np.ndarray, ori_positions: list[int], genome_label: str = "genome", max_points: int = 4000) -> None:
     """
     Plots the skew array and highlights the estimated origin(s) of replication.
 
+    Skew arrays longer than `max_points` are reduced with `decimate_minmax()` before 
+    plotting; the minima are kept, and the ori markers use the full array.
+
     Args:
-        skew (list[int]): Skew values computed across the genome.
+        skew (list[int] | np.ndarray): Skew values computed across the genome.
         ori_positions (list[int]): Positions where the skew reaches its minimum (possible ori sites).
         genome_label (str, optional): Name of the genome to show in the title. Default is "genome".
+        max_points (int, optional): Maximum number of points drawn. Default is 4000.
 
     Returns:
         None: The function displays the plot using matplotlib.
@@ -86,7 +143,7 @@ def plot_skew_array_with_ori(skew: list[int], ori_positions: list[int], genome_l
         >>> ori_pos = MinimumSkew(genome)
         >>> plot_skew_array_with_ori(skew, ori_pos, genome_label="E. coli")
     """
-    fig=plot_skew_array_with_ori_impl(skew, ori_positions,  "genome")
+    fig=plot_skew_array_with_ori_impl(skew, ori_positions,  "genome", max_points)
     fig.show()
 
 def plot_motiflogo_impl(motifs: list[str], font_name='Arial Rounded MT Bold'):
@@ -21,6 +21,7 @@ from matplotlib.figure import Figure
 from pydantic import BaseModel, field_validator
 import GenomeVisualizer
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 HERE = pathlib.Path(__file__).parent
@@ -187,8 +188,9 @@ async def skew_page(request: Request, input: Annotated[GenomeInput, Form()]):
         genome = (await genome.read()).decode()
         genome = ensure_genome(genome)
 
-    skew_array = GenomeVisualizer.SkewArray(genome)
-    min_skew = GenomeVisualizer.basic.MinPositions(skew_array)
+    skew_array = GenomeVisualizer.CompactSkewArray(genome)
+    # the minimum is read from the skew already computed instead of a second pass
+    min_skew = np.flatnonzero(skew_array == skew_array.min()).tolist()
 
     label = ""
     if not isinstance(input.pattern, str):
@@ -218,7 +220,7 @@ async def symbol_page(request: Request, input: Annotated[SymbolInput, Form()]):
         genome = (await genome.read()).decode()
         genome = ensure_genome(genome)
 
-    symbol_array = GenomeVisualizer.FasterSymbolArray(genome, input.symbol)
+    symbol_array = GenomeVisualizer.WindowedComposition(genome, symbols=input.symbol)[input.symbol]
 
     label = ""
     if not isinstance(input.genome, str):
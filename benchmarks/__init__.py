@@ -0,0 +1 @@
+"""Benchmark suite for the public GenomeVisualizer functions (see run.py)."""
@@ -0,0 +1,347 @@
+import logging
+import os
+import random
+from collections.abc import Callable
+
+import matplotlib
+
+matplotlib.use("Agg")
+# plot_motiflogo asks for a font that is usually not installed
+logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import GenomeVisualizer as gv
+
+from .datasets import GenomeData, MotifData
+
+PATTERN = "ATGATCAAG"
+
+class Case:
+    """
+    A benchmark of one public function.
+
+    Attributes:
+        name (str): The name exported in `GenomeVisualizer.__all__`.
+        kind (str): "genome" for cases run on every synthetic genome, "motifs" for cases run
+            on every motif dataset.
+        setup (Callable): Builds the inputs from a dataset outside the timed region and returns
+            the zero-argument callable that is timed.
+        max_size (int | None): Largest genome the case is run on, for functions whose time or
+            memory grows too fast to be useful on bigger inputs.
+    """
+
+    def __init__(self, name: str, kind: str, setup: Callable, max_size: int | None = None) -> None:
+        self.name = name
+        self.kind = kind
+        self.setup = setup
+        self.max_size = max_size
+
+CASES: dict[str, Case] = {}
+
+def case(name: str, kind: str = "genome", max_size: int | None = None) -> Callable:
+    """Registers the decorated setup function as the benchmark of `name`."""
+    def register(setup: Callable) -> Callable:
+        CASES[name] = Case(name, kind, setup, max_size)
+        return setup
+    return register
+
+def _close_figures(function: Callable) -> Callable:
+    """Wraps a plotting call so the figures it creates are closed after each run."""
+    def run() -> None:
+        function()
+        plt.close("all")
+    return run
+
+# Basic
+
+@case("load_genome")
+def _(data: GenomeData):
+    path = data.path(fasta=True)
+    return lambda: gv.load_genome(path)
+
+@case("load_genome_from_txt")
+def _(data: GenomeData):
+    path = data.path(fasta=False)
+    return lambda: gv.load_genome_from_txt(path)
+
+@case("iter_genome_chunks")
+def _(data: GenomeData):
+    path = data.path(fasta=True)
+    return lambda: sum(len(chunk) for chunk in gv.iter_genome_chunks(path))
+
+@case("PackedGenome")
+def _(data: GenomeData):
+    return lambda: gv.PackedGenome(data.text)
+
+@case("CountKmers")
+def _(data: GenomeData):
+    return lambda: gv.CountKmers(data.text, 12)
+
+@case("KmerCounts")
+def _(data: GenomeData):
+    counts = gv.CountKmers(data.text, 12)
+    return lambda: counts.most_frequent()
+
+@case("FrequencyMap", max_size=10_000_000)
+def _(data: GenomeData):
+    return lambda: gv.FrequencyMap(data.text, 9)
+
+@case("FrequentWords")
+def _(data: GenomeData):
+    return lambda: gv.FrequentWords(data.text, 9)
+
+@case("KmerSketch")
+def _(data: GenomeData):
+    return lambda: gv.KmerSketch(12).update(data.text)
+
+@case("FrequentWordsStreaming")
+def _(data: GenomeData):
+    chunks = data.chunks()
+    return lambda: gv.FrequentWordsStreaming(chunks, 12, top=10)
+
+@case("FindClumps")
+def _(data: GenomeData):
+    return lambda: gv.FindClumps(data.text, 9, 500, 3)
+
+# Motifs
+
+@case("Count", "motifs")
+def _(data: MotifData):
+    return lambda: gv.Count(data.motifs)
+
+@case("Profile", "motifs")
+def _(data: MotifData):
+    return lambda: gv.Profile(data.motifs)
+
+@case("Consensus", "motifs")
+def _(data: MotifData):
+    return lambda: gv.Consensus(data.motifs)
+
+@case("Score", "motifs")
+def _(data: MotifData):
+    return lambda: gv.Score(data.motifs)
+
+@case("CountWithPseudocounts", "motifs")
+def _(data: MotifData):
+    return lambda: gv.CountWithPseudocounts(data.motifs)
+
+@case("ProfileWithPseudocounts", "motifs")
+def _(data: MotifData):
+    return lambda: gv.ProfileWithPseudocounts(data.motifs)
+
+@case("CountMatrix", "motifs")
+def _(data: MotifData):
+    return lambda: gv.CountMatrix(data.motifs, pseudocount=1)
+
+@case("ProfileMatrix", "motifs")
+def _(data: MotifData):
+    return lambda: gv.ProfileMatrix(data.motifs, pseudocount=1)
+
+@case("Pr", "motifs")
+def _(data: MotifData):
+    return lambda: gv.Pr(data.motif, data.profile)
+
+@case("ProfileMostProbableKmer", "motifs")
+def _(data: MotifData):
+    return lambda: gv.ProfileMostProbableKmer(data.Dna[0], data.k, data.profile)
+
+@case("Motifs", "motifs")
+def _(data: MotifData):
+    return lambda: gv.Motifs(data.profile, data.Dna)
+
+@case("RandomMotifs", "motifs")
+def _(data: MotifData):
+    random.seed(0)
+    return lambda: gv.RandomMotifs(data.Dna, data.k, data.t)
+
+@case("GreedyMotifSearch", "motifs")
+def _(data: MotifData):
+    return lambda: gv.GreedyMotifSearch(data.Dna, data.k, data.t)
+
+@case("GreedyMotifSearchWithPseudocounts", "motifs")
+def _(data: MotifData):
+    return lambda: gv.GreedyMotifSearchWithPseudocounts(data.Dna, data.k, data.t)
+
+@case("RandomizedMotifSearch", "motifs")
+def _(data: MotifData):
+    random.seed(0)
+    return lambda: gv.RandomizedMotifSearch(data.Dna, data.k, data.t)
+
+@case("GibbsSampler", "motifs")
+def _(data: MotifData):
+    return lambda: gv.GibbsSampler(data.Dna, data.k, data.t, 1000, sample=True, rng=np.random.default_rng(0))
+
+@case("MotifSearchRestarts", "motifs")
+def _(data: MotifData):
+    return lambda: gv.MotifSearchRestarts(data.Dna, data.k, data.t, 20, seed=0)
+
+@case("Normalize", "motifs")
+def _(data: MotifData):
+    probabilities = {text[:data.k]: gv.Pr(text[:data.k], data.profile) for text in data.Dna}
+    return lambda: gv.Normalize(dict(probabilities))
+
+@case("WeightedDie", "motifs")
+def _(data: MotifData):
+    probabilities = gv.Normalize({text[:data.k]: gv.Pr(text[:data.k], data.profile) for text in data.Dna})
+    random.seed(0)
+    return lambda: gv.WeightedDie(probabilities)
+
+@case("ProfileGeneratedString", "motifs")
+def _(data: MotifData):
+    random.seed(0)
+    return lambda: gv.ProfileGeneratedString(data.Dna[0], data.profile, data.k)
+
+@case("ProfileRandomKmer", "motifs")
+def _(data: MotifData):
+    rng = np.random.default_rng(0)
+    return lambda: gv.ProfileRandomKmer(data.Dna[0], data.profile, data.k, rng=rng, size=1000)
+
+@case("DistanceBetweenPatternAndStrings", "motifs")
+def _(data: MotifData):
+    return lambda: gv.DistanceBetweenPatternAndStrings(data.motif, data.Dna)
+
+@case("MedianString", "motifs")
+def _(data: MotifData):
+    # the exact search is exponential in k, so it runs on a bounded motif length
+    k = min(data.k, 7)
+    return lambda: gv.MedianString(data.Dna, k)
+
+@case("ScanProfile")
+def _(data: GenomeData):
+    profile = gv.ProfileWithPseudocounts(["TTATCCACA", "TTATCCACA", "TTATGCACA", "TCATCCACA"])
+    return lambda: gv.ScanProfile(data.text, profile, top=10, reverse_complement=True)
+
+@case("PWM")
+def _(data: GenomeData):
+    pwm = gv.PWM(gv.ProfileWithPseudocounts(["TTATCCACA", "TTATCCACA", "TTATGCACA", "TCATCCACA"]))
+    return lambda: pwm.scan(data.text, 0.8 * pwm.max_score, reverse_complement=True)
+
+# Replication
+
+@case("PatternCount")
+def _(data: GenomeData):
+    return lambda: gv.PatternCount(data.text, PATTERN)
+
+@case("PatternMatching")
+def _(data: GenomeData):
+    return lambda: gv.PatternMatching(PATTERN, data.text)
+
+@case("PatternMatchingMany")
+def _(data: GenomeData):
+    step = max(1, (data.size - 9) // 100)
+    patterns = [data.text[i:i + 9] for i in range(0, 100 * step, step) if i + 9 <= data.size]
+    return lambda: gv.PatternMatchingMany(patterns, data.text, reverse_complement=True)
+
+@case("PatternMatchingBothStrands")
+def _(data: GenomeData):
+    return lambda: gv.PatternMatchingBothStrands(PATTERN, data.text)
+
+@case("Reverse")
+def _(data: GenomeData):
+    return lambda: gv.Reverse(data.text)
+
+@case("Complement")
+def _(data: GenomeData):
+    return lambda: gv.Complement(data.text)
+
+@case("ReverseComplement")
+def _(data: GenomeData):
+    return lambda: gv.ReverseComplement(data.text)
+
+@case("ReverseComplementFile")
+def _(data: GenomeData):
+    path = data.path(fasta=True)
+    def run() -> int:
+        with open(os.devnull, "w") as output:
+            return gv.ReverseComplementFile(path, output)
+    return run
+
+@case("GenomeIndex", max_size=10_000_000)
+def _(data: GenomeData):
+    return lambda: gv.GenomeIndex(data.text).locate(PATTERN)
+
+@case("FasterSymbolArray", max_size=10_000_000)
+def _(data: GenomeData):
+    return lambda: gv.FasterSymbolArray(data.text, "C")
+
+@case("WindowedComposition")
+def _(data: GenomeData):
+    window = max(1, data.size // 100)
+    return lambda: gv.WindowedComposition(data.text, window=window, step=max(1, window // 10))
+
+@case("SkewArray", max_size=10_000_000)
+def _(data: GenomeData):
+    return lambda: gv.SkewArray(data.text)
+
+@case("CompactSkewArray")
+def _(data: GenomeData):
+    return lambda: gv.CompactSkewArray(data.text)
+
+@case("MinimumSkew")
+def _(data: GenomeData):
+    return lambda: gv.MinimumSkew(data.text)
+
+@case("StreamingMinimumSkew")
+def _(data: GenomeData):
+    chunks = data.chunks()
+    return lambda: gv.StreamingMinimumSkew(chunks)
+
+@case("HammingDistance")
+def _(data: GenomeData):
+    p, q = data.text[:1000], data.text[1000:2000]
+    return lambda: gv.HammingDistance(p, q)
+
+@case("HammingDistances")
+def _(data: GenomeData):
+    return lambda: gv.HammingDistances(PATTERN, data.text)
+
+@case("HammingDistanceMatrix")
+def _(data: GenomeData):
+    count = min(2000, data.size // 12)
+    kmers = [data.text[i * 12:i * 12 + 12] for i in range(count)]
+    return lambda: gv.HammingDistanceMatrix(kmers)
+
+@case("ApproximatePatternMatching")
+def _(data: GenomeData):
+    return lambda: gv.ApproximatePatternMatching(data.text, PATTERN, 2)
+
+@case("ApproximatePatternCount")
+def _(data: GenomeData):
+    return lambda: gv.ApproximatePatternCount(PATTERN, data.text, 2)
+
+@case("ApproximatePatternMatchingBothStrands")
+def _(data: GenomeData):
+    return lambda: gv.ApproximatePatternMatchingBothStrands(data.text, PATTERN, 1)
+
+@case("FrequentWordsWithMismatches", max_size=10_000_000)
+def _(data: GenomeData):
+    return lambda: gv.FrequentWordsWithMismatches(data.text, 9, 1)
+
+# Visualization
+
+@case("decimate_minmax")
+def _(data: GenomeData):
+    skew = gv.CompactSkewArray(data.text)
+    positions = np.arange(len(skew))
+    return lambda: gv.decimate_minmax(positions, skew)
+
+@case("plot_symbol_array")
+def _(data: GenomeData):
+    counts = gv.WindowedComposition(data.text, window=data.size // 2, step=max(1, data.size // 100_000), symbols="C")["C"]
+    return _close_figures(lambda: gv.plot_symbol_array(counts, "C"))
+
+@case("plot_skew_array_with_ori")
+def _(data: GenomeData):
+    skew = gv.CompactSkewArray(data.text)
+    ori = gv.MinimumSkew(data.text)
+    return _close_figures(lambda: gv.plot_skew_array_with_ori(skew, ori))
+
+@case("plot_motiflogo", "motifs")
+def _(data: MotifData):
+    return _close_figures(lambda: gv.plot_motiflogo(data.motifs))
+
+def missing_cases() -> list[str]:
+    """Returns the callables exported in `GenomeVisualizer.__all__` that have no benchmark."""
+    return [name for name in gv.__all__ if callable(getattr(gv, name)) and name not in CASES]
@@ -0,0 +1,161 @@
+import os
+import tempfile
+
+import numpy as np
+
+from GenomeVisualizer import PackedGenome, ProfileWithPseudocounts
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1M": 1_000_000, "10M": 10_000_000, "100M": 100_000_000}
+
+def parse_size(label: str) -> int:
+    """
+    Converts a genome size label such as "10k", "1M" or "250000" into a number of bases.
+
+    Args:
+        label (str): A size with an optional 'k' (thousand) or 'M' (million) suffix.
+
+    Returns:
+        int: The number of bases.
+
+    Example:
+        >>> parse_size("10M")
+        10000000
+    """
+    if label in SIZES:
+        return SIZES[label]
+    multipliers = {"k": 1_000, "M": 1_000_000}
+    if label[-1:] in multipliers:
+        return int(float(label[:-1]) * multipliers[label[-1]])
+    return int(label)
+
+def synthetic_genome(length: int, seed: int = 0) -> str:
+    """
+    Generates a deterministic random genome with a replication-like GC skew.
+
+    The bases are drawn independently with a 50% GC content. In the first half of the
+    genome, C is slightly more frequent than G, and in the second half the bias is reversed,
+    so the skew diagram has a clear minimum in the middle, as in bacterial genomes. A few
+    copies of the DnaA box "TTATCCACA" (and its reverse complement) are planted around the
+    minimum so origin-finding functions have something to find.
+
+    Args:
+        length (int): Number of bases.
+        seed (int, optional): Seed of the random generator. Default is 0.
+
+    Returns:
+        str: The genome, identical for identical arguments.
+    """
+    rng = np.random.default_rng(seed)
+    half = length // 2
+    # probabilities of A, C, G, T before and after the skew minimum
+    before = rng.choice(np.frombuffer(b"ACGT", dtype=np.uint8), size=half, p=[0.25, 0.26, 0.24, 0.25])
+    after = rng.choice(np.frombuffer(b"ACGT", dtype=np.uint8), size=length - half, p=[0.25, 0.24, 0.26, 0.25])
+    bases = np.concatenate((before, after))
+    boxes = [np.frombuffer(b"TTATCCACA", dtype=np.uint8), np.frombuffer(b"TGTGGATAA", dtype=np.uint8)]
+    for copy, position in enumerate(range(half - 200, half + 200, 80)):
+        if 0 <= position and position + 9 <= length:
+            bases[position:position + 9] = boxes[copy % 2]
+    return bases.tobytes().decode("ascii")
+
+def motif_dataset(t: int, k: int, n: int = 500, mutations: int = 2, seed: int = 0) -> tuple[list[str], str]:
+    """
+    Generates `t` random DNA strings, each carrying a mutated copy of one implanted k-mer.
+
+    Args:
+        t (int): Number of strings.
+        k (int): Length of the implanted motif.
+        n (int, optional): Length of each string. Default is 500.
+        mutations (int, optional): Number of random substitutions in each implanted copy. Default is 2.
+        seed (int, optional): Seed of the random generator. Default is 0.
+
+    Returns:
+        tuple[list[str], str]: The strings and the implanted motif.
+    """
+    rng = np.random.default_rng(seed)
+    letters = np.frombuffer(b"ACGT", dtype=np.uint8)
+    motif = letters[rng.integers(4, size=k)]
+    Dna = []
+    for _ in range(t):
+        text = letters[rng.integers(4, size=n)]
+        copy = motif.copy()
+        copy[rng.choice(k, size=min(mutations, k), replace=False)] = letters[rng.integers(4, size=min(mutations, k))]
+        position = int(rng.integers(n - k + 1))
+        text[position:position + k] = copy
+        Dna.append(text.tobytes().decode("ascii"))
+    return Dna, motif.tobytes().decode("ascii")
+
+class GenomeData:
+    """
+    A synthetic genome with the derived inputs the benchmarks need, built lazily.
+
+    Attributes:
+        size (int): Number of bases.
+        label (str): Name used in the results, such as "genome-1M".
+        text (str): The genome sequence.
+    """
+
+    def __init__(self, label: str, seed: int = 0, directory: str | None = None) -> None:
+        self.size = parse_size(label)
+        self.label = f"genome-{label}"
+        self.text = synthetic_genome(self.size, seed)
+        self._directory = directory
+        self._packed = None
+        self._paths = {}
+
+    @property
+    def packed(self) -> PackedGenome:
+        """The genome packed four bases per byte."""
+        if self._packed is None:
+            self._packed = PackedGenome(self.text)
+        return self._packed
+
+    def path(self, fasta: bool) -> str:
+        """Returns the path of the genome written as a FASTA file (60 bases per line) or as plain text."""
+        if fasta not in self._paths:
+            if self._directory is None:
+                self._directory = tempfile.mkdtemp(prefix="genomevisualizer-bench-")
+            path = os.path.join(self._directory, f"{self.label}.{'fasta' if fasta else 'txt'}")
+            with open(path, "w") as file:
+                if fasta:
+                    file.write(f">{self.label}\n")
+                    for start in range(0, self.size, 1 << 20):
+                        block = self.text[start:start + (1 << 20)]
+                        file.write("\n".join(block[i:i + 60] for i in range(0, len(block), 60)))
+                        file.write("\n")
+                else:
+                    file.write(self.text)
+            self._paths[fasta] = path
+        return self._paths[fasta]
+
+    def chunks(self, chunk_size: int = 1 << 20) -> list[str]:
+        """Returns the genome cut into consecutive chunks, as produced by `iter_genome_chunks()`."""
+        return [self.text[start:start + chunk_size] for start in range(0, self.size, chunk_size)]
+
+    def cleanup(self) -> None:
+        """Removes the files written by `path()`."""
+        for path in self._paths.values():
+            os.remove(path)
+        self._paths = {}
+
+class MotifData:
+    """
+    A motif-finding dataset of `t` strings of length `n` with an implanted k-mer.
+
+    Attributes:
+        t (int): Number of strings.
+        k (int): Motif length.
+        label (str): Name used in the results, such as "motifs-t10-k8".
+        Dna (list[str]): The strings.
+        motif (str): The implanted motif.
+        motifs (list[str]): The k-mers at the start of each string, a fixed motif matrix.
+        profile (dict[str, list[float]]): Pseudocount profile of `motifs`.
+    """
+
+    def __init__(self, label: str, seed: int = 0, n: int = 500) -> None:
+        t, k = (int(value) for value in label.lower().split("x"))
+        self.t = t
+        self.k = k
+        self.label = f"motifs-t{t}-k{k}"
+        self.Dna, self.motif = motif_dataset(t, k, n, seed=seed)
+        self.motifs = [text[:k] for text in self.Dna]
+        self.profile = ProfileWithPseudocounts(self.motifs)
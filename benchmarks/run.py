@@ -0,0 +1,227 @@
+"""
+Benchmarks every function exported in `GenomeVisualizer.__all__` and compares runs.
+
+Run the suite (with the package installed, or with `PYTHONPATH=ToolBox`) from the repository root:
+
+    python -m benchmarks.run run --sizes 10k 100k 1M --output results.json
+    python -m benchmarks.run compare baseline.json results.json
+"""
+import argparse
+import datetime
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+import GenomeVisualizer as gv
+
+from .cases import CASES, missing_cases
+from .datasets import GenomeData, MotifData
+
+DEFAULT_SIZES = ["10k", "100k", "1M"]
+DEFAULT_MOTIFS = ["10x8", "50x12", "200x15"]
+
+def measure_time(function: Callable, repeat: int, min_time: float = 0.01) -> tuple[list[float], int]:
+    """
+    Times a zero-argument callable.
+
+    The callable is run once to warm up and calibrate: calls faster than `min_time` are
+    grouped into loops of `number` calls so each measurement is long enough for the clock.
+    Calls slower than 10 seconds are measured only once.
+
+    Args:
+        function (Callable): The function to time.
+        repeat (int): Number of measurements.
+        min_time (float, optional): Minimum duration of one measurement in seconds. Default is 0.01.
+
+    Returns:
+        tuple[list[float], int]: The seconds per call of every measurement and the number of calls per measurement.
+    """
+    began = time.perf_counter()
+    function()
+    first = time.perf_counter() - began
+    number = 1 if first >= min_time else min(100_000, math.ceil(min_time / max(first, 1e-9)))
+    if first > 10:
+        return [first], 1
+    seconds = []
+    for _ in range(repeat):
+        began = time.perf_counter()
+        for _ in range(number):
+            function()
+        seconds.append((time.perf_counter() - began) / number)
+    return seconds, number
+
+def measure_memory(function: Callable) -> int:
+    """Returns the peak memory in bytes allocated by one call of a zero-argument callable, traced with `tracemalloc`."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def _git_commit() -> str | None:
+    """Returns the current git commit of the working tree, if any."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(sizes: list[str], motifs: list[str], repeat: int = 3, names: list[str] | None = None, seed: int = 0, memory: bool = True) -> dict:
+    """
+    Runs the benchmarks on synthetic genomes and motif datasets.
+
+    Args:
+        sizes (list[str]): Genome size labels, such as "10k" or "100M".
+        motifs (list[str]): Motif dataset labels "TxK" (t strings, motif length k).
+        repeat (int, optional): Number of timing measurements per benchmark. Default is 3.
+        names (list[str] | None, optional): Only run the cases whose name contains one of these
+            strings. Default is None (all cases).
+        seed (int, optional): Seed of the synthetic datasets. Default is 0.
+        memory (bool, optional): Also measure the peak memory of each benchmark. Default is True.
+
+    Returns:
+        dict: The run metadata and one result record per benchmark and dataset.
+    """
+    selected = [case for case in CASES.values() if names is None or any(name in case.name for name in names)]
+    results = []
+    datasets = [("motifs", MotifData(label, seed)) for label in motifs]
+    datasets += [("genome", label) for label in sizes]
+    for kind, data in datasets:
+        if kind == "genome":
+            # genomes are built one at a time so only one is held in memory
+            data = GenomeData(data, seed)
+        try:
+            for case in selected:
+                if case.kind != kind:
+                    continue
+                record = {"name": case.name, "dataset": data.label}
+                record["input_size"] = data.size if kind == "genome" else data.t * len(data.Dna[0])
+                if case.max_size is not None and kind == "genome" and data.size > case.max_size:
+                    record["status"] = "skipped"
+                    results.append(record)
+                    print(_format_record(record), file=sys.stderr, flush=True)
+                    continue
+                try:
+                    function = case.setup(data)
+                    seconds, number = measure_time(function, repeat)
+                    record.update(status="ok", seconds=seconds, number=number, best=min(seconds), median=float(np.median(seconds)))
+                    record["throughput"] = record["input_size"] / record["best"] if record["best"] > 0 else None
+                    if memory:
+                        record["peak_bytes"] = measure_memory(function)
+                except Exception as error:
+                    record.update(status="error", error=f"{type(error).__name__}: {error}")
+                results.append(record)
+                print(_format_record(record), file=sys.stderr, flush=True)
+        finally:
+            if kind == "genome":
+                data.cleanup()
+    meta = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "genomevisualizer": gv.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "commit": _git_commit(),
+        "sizes": sizes,
+        "motifs": motifs,
+        "repeat": repeat,
+        "seed": seed,
+        "missing": missing_cases(),
+    }
+    return {"meta": meta, "results": results}
+
+def _format_record(record: dict) -> str:
+    """Formats one result record as a line of the progress table."""
+    label = f"{record['name']:<38} {record['dataset']:<18}"
+    if record["status"] != "ok":
+        return f"{label} {record['status']} {record.get('error', '')}".rstrip()
+    memory = f"{record['peak_bytes'] / 2 ** 20:10.1f} MiB" if "peak_bytes" in record else ""
+    return f"{label} {record['best'] * 1e3:12.3f} ms {memory}"
+
+def compare_results(baseline: dict, current: dict, tolerance: float = 0.2, memory_tolerance: float = 0.2, min_seconds: float = 1e-4) -> list[dict]:
+    """
+    Compares two benchmark runs and lists the regressions.
+
+    A benchmark regresses in time when its best time grew by more than `tolerance` (relative)
+    and by more than `min_seconds`, and in memory when its peak grew by more than
+    `memory_tolerance` and by more than 1 MiB. Benchmarks that now fail also count.
+
+    Args:
+        baseline (dict): The reference run, as returned by `run_suite()`.
+        current (dict): The new run.
+        tolerance (float, optional): Allowed relative slowdown. Default is 0.2.
+        memory_tolerance (float, optional): Allowed relative growth of the peak memory. Default is 0.2.
+        min_seconds (float, optional): Slowdowns smaller than this are ignored as noise. Default is 1e-4.
+
+    Returns:
+        list[dict]: One record per regression, with the benchmark, the metric and both values.
+    """
+    reference = {(record["name"], record["dataset"]): record for record in baseline["results"]}
+    regressions = []
+    for record in current["results"]:
+        before = reference.get((record["name"], record["dataset"]))
+        if before is None or before["status"] != "ok":
+            continue
+        key = {"name": record["name"], "dataset": record["dataset"]}
+        if record["status"] == "error":
+            regressions.append({**key, "metric": "status", "baseline": "ok", "current": record["error"]})
+            continue
+        if record["status"] != "ok":
+            continue
+        if record["best"] > before["best"] * (1 + tolerance) and record["best"] - before["best"] > min_seconds:
+            regressions.append({**key, "metric": "seconds", "baseline": before["best"], "current": record["best"]})
+        if "peak_bytes" in record and "peak_bytes" in before:
+            grown = record["peak_bytes"] - before["peak_bytes"]
+            if record["peak_bytes"] > before["peak_bytes"] * (1 + memory_tolerance) and grown > 2 ** 20:
+                regressions.append({**key, "metric": "peak_bytes", "baseline": before["peak_bytes"], "current": record["peak_bytes"]})
+    return regressions
+
+def main(arguments: list[str] | None = None) -> int:
+    """Command line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description="Benchmark the public GenomeVisualizer functions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run the benchmarks and write the results as JSON")
+    run.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="genome sizes, from 10k to 100M (default: %(default)s)")
+    run.add_argument("--motifs", nargs="+", default=DEFAULT_MOTIFS, help="motif datasets as TxK (default: %(default)s)")
+    run.add_argument("--repeat", type=int, default=3, help="timing measurements per benchmark (default: %(default)s)")
+    run.add_argument("--filter", nargs="+", dest="names", help="only run benchmarks whose name contains one of these strings")
+    run.add_argument("--seed", type=int, default=0, help="seed of the synthetic datasets (default: %(default)s)")
+    run.add_argument("--no-memory", action="store_false", dest="memory", help="skip the peak memory measurements")
+    run.add_argument("--output", default="benchmark-results.json", help="output JSON file (default: %(default)s)")
+    compare = commands.add_parser("compare", help="flag regressions between two result files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown (default: %(default)s)")
+    compare.add_argument("--memory-tolerance", type=float, default=0.2, help="allowed relative memory growth (default: %(default)s)")
+    compare.add_argument("--min-seconds", type=float, default=1e-4, help="ignore slowdowns smaller than this (default: %(default)s)")
+    options = parser.parse_args(arguments)
+
+    if options.command == "run":
+        report = run_suite(options.sizes, options.motifs, options.repeat, options.names, options.seed, options.memory)
+        with open(options.output, "w") as file:
+            json.dump(report, file, indent=2)
+        if report["meta"]["missing"]:
+            print(f"No benchmark for: {', '.join(report['meta']['missing'])}", file=sys.stderr)
+        print(f"Wrote {len(report['results'])} results to {options.output}", file=sys.stderr)
+        return 0
+
+    with open(options.baseline) as file:
+        baseline = json.load(file)
+    with open(options.current) as file:
+        current = json.load(file)
+    regressions = compare_results(baseline, current, options.tolerance, options.memory_tolerance, options.min_seconds)
+    for regression in regressions:
+        print(f"REGRESSION {regression['name']} [{regression['dataset']}] {regression['metric']}: {regression['baseline']} -> {regression['current']}")
+    print(f"{len(regressions)} regression(s) found.")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import io
+import random
+
+import pytest
+
+from GenomeVisualizer import ReverseComplement, ReverseComplementFile, load_genome
+from GenomeVisualizer.basic import _iter_sequence_blocks, _iter_sequence_blocks_reversed
+
+
+def naive_parse(data: bytes) -> str:
+    """Parses a genome file line by line: header and comment lines are dropped, the rest is uppercased."""
+    lines = data.decode("ascii").replace("\r\n", "\n").split("\n")
+    return "".join(line.strip() for line in lines if not line.startswith((">", ";"))).upper()
+
+
+FILES = [
+    b">chr1 first record\nACGTAC\nGTTTGA\n>chr2\nCCCCAA\nTTGG\n",
+    b">chr1 description with ACGT letters\r\nACGTAC\r\nggttAA\r\n;comment > ; inside\r\nTTGCA\r\n",
+    b";leading comment\n;another one\n>header\nAC\n\nGT\n>\n>empty record\nA",
+    b"ACGTACGTACGTACGTACGTACGTACGT",
+    b"ACGT\r\n\r\nacgt\r\n;trailing comment",
+    b">only header with no newline at the end",
+    b">h\nA\n>h2\n",
+]
+
+
+def random_file(rng: random.Random) -> bytes:
+    lines = []
+    for _ in range(rng.randint(1, 12)):
+        if rng.random() < 0.3:
+            lines.append(rng.choice(">;") + "".join(rng.choice("ACGTxyz ;>") for _ in range(rng.randint(0, 15))))
+        else:
+            lines.append("".join(rng.choice("ACGTacgt") for _ in range(rng.randint(0, 20))))
+    newline = rng.choice(["\n", "\r\n"])
+    return (newline.join(lines) + rng.choice(["", newline])).encode("ascii")
+
+
+def write(tmp_path, data: bytes) -> str:
+    path = tmp_path / "genome.fasta"
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.mark.parametrize("data", FILES)
+@pytest.mark.parametrize("block_size", [1, 2, 3, 5, 7, 64])
+def test_blocks_match_naive_parser(tmp_path, data, block_size):
+    path = write(tmp_path, data)
+    expected = naive_parse(data)
+    forward = b"".join(_iter_sequence_blocks(path, block_size)).decode("ascii")
+    reverse = b"".join(reversed(list(_iter_sequence_blocks_reversed(path, block_size)))).decode("ascii")
+    assert forward == expected
+    assert reverse == expected
+
+
+def test_random_files_at_tiny_block_sizes(tmp_path):
+    rng = random.Random(0)
+    for _ in range(300):
+        data = random_file(rng)
+        if not data:
+            continue
+        path = write(tmp_path, data)
+        expected = naive_parse(data)
+        valid = not expected.strip("ACGT")
+        for block_size in (1, 2, 3, rng.randint(4, 40)):
+            if valid:
+                assert b"".join(_iter_sequence_blocks(path, block_size)).decode("ascii") == expected
+                assert b"".join(reversed(list(_iter_sequence_blocks_reversed(path, block_size)))).decode("ascii") == expected
+            else:
+                with pytest.raises(ValueError):
+                    b"".join(_iter_sequence_blocks(path, block_size))
+                with pytest.raises(ValueError):
+                    b"".join(_iter_sequence_blocks_reversed(path, block_size))
+
+
+def test_reverse_complement_file_at_tiny_block_sizes(tmp_path):
+    data = b">chr1 ACGT header\r\nACGTTTGA\r\n;note\r\nccgAAT\r\n>chr2\r\nGGGA"
+    path = write(tmp_path, data)
+    for block_size in range(1, 12):
+        output = io.StringIO()
+        written = ReverseComplementFile(path, output, block_size)
+        assert output.getvalue() == ReverseComplement(naive_parse(data))
+        assert written == len(naive_parse(data))
+
+
+def test_mid_line_header_character_is_invalid(tmp_path):
+    path = write(tmp_path, b">h\nACGT>ACGT\n")
+    with pytest.raises(ValueError):
+        load_genome(path)
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from GenomeVisualizer import PWM
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_pwm_scan_finds_best_kmer_at_max_score(seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(100):
+        k = int(rng.integers(1, 16))
+        matrix = rng.random((4, k)) + 0.01
+        matrix /= matrix.sum(axis=0)
+        pwm = PWM(matrix)
+        best = "".join("ACGT"[code] for code in matrix.argmax(axis=0))
+        assert pwm.score(best) == pwm.max_score
+        assert pwm.scan(best, pwm.max_score) == [(0, "+", pwm.max_score)]
+        # flanked by other bases the best window is still the only hit
+        text = "A" * 3 + best + "T" * 3
+        assert (3, "+", pwm.max_score) in pwm.scan(text, pwm.max_score)
+
+
+def test_pwm_scan_matches_full_scores():
+    rng = np.random.default_rng(1)
+    matrix = rng.random((4, 8)) + 0.01
+    matrix /= matrix.sum(axis=0)
+    pwm = PWM(matrix)
+    text = "".join(rng.choice(list("ACGT"), size=2000))
+    threshold = pwm.min_score + 0.7 * (pwm.max_score - pwm.min_score)
+    for reverse, strand in ((False, "+"), (True, "-")):
+        scores = pwm.scores(text, reverse_complement=reverse)
+        expected = [(int(i), strand, float(scores[i])) for i in np.flatnonzero(scores >= threshold)]
+        found = [hit for hit in pwm.scan(text, threshold, reverse_complement=True) if hit[1] == strand]
+        assert found == expected